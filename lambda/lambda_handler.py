@@ -1,15 +1,48 @@
 """AWS Lambda handler for processing recipe emails via SES."""
 
+import base64
+import functools
+import importlib
 import json
 import os
 import email
 import boto3
+import httpx
 from email import policy
-from email.parser import BytesParser
-from typing import Optional, List, Dict, Any
+from email.parser import BytesFeedParser, BytesHeaderParser
+from typing import Any
 import re
 import sys
 import logging
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+# Import recipe-duck modules once per container
+sys.path.insert(0, '/opt/python')  # Lambda layer path
+from anthropic import DefaultHttpxClient
+from recipe_duck.notion_client import HTTP2_AVAILABLE, NotionRecipeClient
+from recipe_duck.processor import RESIZE_MIN_BYTES, RecipeProcessor, downscale_image
+
+# Faster JSON serialization when orjson is available
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Native (Rust) MIME parser for large attachment emails, enabled via USE_FAST_MAIL_PARSER
+try:
+    import fast_mail_parser
+except ImportError:
+    fast_mail_parser = None
 
 # Configure logging
 logger = logging.getLogger()
@@ -17,18 +50,153 @@ logger.setLevel(logging.INFO)
 
 # Initialize AWS clients
 s3_client = boto3.client('s3')
-secrets_client = boto3.client('secretsmanager')
+
+# Secrets Manager client, only created if the secrets extension is unavailable.
+# boto3.client() isn't thread-safe, so concurrent get_secret calls create it under a lock.
+_secrets_client = None
+_secrets_client_lock = threading.Lock()
 
 # Cache for secrets (Lambda container reuse)
-_secrets_cache: Dict[str, str] = {}
+_secrets_cache: dict[str, str] = {}
+
+# AWS Parameters and Secrets Lambda Extension local endpoint. The extension keeps
+# its own TTL cache (SECRETS_MANAGER_TTL) across invocations in the execution environment.
+SECRETS_EXTENSION_ENDPOINT = (
+    f"http://localhost:{os.environ.get('PARAMETERS_SECRETS_EXTENSION_HTTP_PORT', '2773')}"
+    "/secretsmanager/get"
+)
+SECRETS_EXTENSION_TIMEOUT = 5
+
+# Patterns for pulling the sender address and recipe URLs out of emails
+_FROM_RE = re.compile(r'<(.+?)>')
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+# Chunk size for streaming email objects from S3
+S3_READ_CHUNK_SIZE = 64 * 1024
+
+# Parse emails with fast_mail_parser instead of the stdlib email package when installed
+USE_FAST_MAIL_PARSER = (
+    os.environ.get('USE_FAST_MAIL_PARSER', 'false').lower() == 'true'
+    and fast_mail_parser is not None
+)
+
+# Bytes fetched up front to read the sender before downloading the whole email
+S3_HEADER_RANGE_BYTES = 16 * 1024
+
+# Downscale attachments before upload (see recipe_duck.processor.downscale_image)
+RESIZE_IMAGES = os.environ.get('RESIZE_IMAGES', 'true').lower() == 'true'
+
+# Upper bound on recipes processed concurrently from a single email
+MAX_WORKERS = int(os.environ.get('MAX_CONCURRENT_RECIPES', '8'))
+
+# Pooled keep-alive connections to the Anthropic API, shared by all processors and
+# sized for concurrent recipe processing. Anthropic sends auth per request, so one
+# pool is safe across API keys; Notion clients get their own pool per instance.
+_anthropic_http_client = DefaultHttpxClient(
+    limits=httpx.Limits(max_keepalive_connections=MAX_WORKERS, max_connections=MAX_WORKERS * 2)
+)
+
+# Clients reused across warm invocations
+_processor_cache: dict[tuple[str, str], RecipeProcessor] = {}
+_notion_client_cache: dict[tuple[str, str], NotionRecipeClient] = {}
 
 # Match CLI default model unless explicitly overridden via environment.
 DEFAULT_MODEL = os.environ.get('ANTHROPIC_MODEL', 'claude-haiku-4-5')
 
+DELETE_EMAILS_AFTER_PROCESSING = (
+    os.environ.get('DELETE_EMAILS_AFTER_PROCESSING', 'true').lower() == 'true'
+)
+
+
+def _reset_after_restore() -> None:
+    """Drop state that must not survive a SnapStart snapshot restore.
+
+    Cached secrets and clients may hold credentials or connections captured
+    in the snapshot; they are rebuilt lazily on the next invocation.
+    """
+    global _secrets_client
+    _secrets_client = None
+    _secrets_cache.clear()
+    _processor_cache.clear()
+    _notion_client_cache.clear()
+
+
+# Modules the SDKs and Pillow only import on first use (HTTP transports, image
+# codec plugins). Loading them in the background at cold start overlaps the
+# import work with fetching secrets and downloading the email.
+PREWARM_MODULES = (
+    'httpcore',
+    'h11',
+    'PIL.JpegImagePlugin',
+    'PIL.PngImagePlugin',
+    'PIL.ImageOps',
+)
+
+
+def _prewarm_imports() -> None:
+    """Import lazily loaded modules so the first invocation doesn't pay for them."""
+    for module_name in PREWARM_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+
+threading.Thread(target=_prewarm_imports, daemon=True).start()
+
+# Register the SnapStart restore hook when running with SnapStart enabled
+try:
+    from snapshot_restore_py import register_after_restore
+    register_after_restore(_reset_after_restore)
+except ImportError:
+    pass  # SnapStart runtime hooks not available
+
+
+def _get_secret_from_extension(secret_name: str) -> str | None:
+    """Retrieve secret via the Parameters and Secrets Lambda Extension.
+
+    Args:
+        secret_name: Name of the secret in Secrets Manager
+
+    Returns:
+        Secret value as string, or None if the extension is not reachable
+    """
+    session_token = os.environ.get('AWS_SESSION_TOKEN')
+    if not session_token:
+        return None
+
+    request = urllib.request.Request(
+        f"{SECRETS_EXTENSION_ENDPOINT}?secretId={quote(secret_name, safe='')}",
+        headers={'X-Aws-Parameters-Secrets-Token': session_token}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=SECRETS_EXTENSION_TIMEOUT) as response:
+            return _loads(response.read())['SecretString']
+    except (urllib.error.URLError, OSError, KeyError, ValueError) as e:
+        logger.info(f"Secrets extension unavailable for {secret_name}, using SDK: {e}")
+        return None
+
+
+def _get_secrets_client() -> Any:
+    """Get the Secrets Manager client, creating it once on first use.
+
+    Returns:
+        boto3 Secrets Manager client
+    """
+    global _secrets_client
+
+    with _secrets_client_lock:
+        if _secrets_client is None:
+            _secrets_client = boto3.client('secretsmanager')
+        return _secrets_client
+
 
 def get_secret(secret_name: str) -> str:
     """Retrieve secret from AWS Secrets Manager with caching.
 
+    Prefers the Parameters and Secrets Lambda Extension (local HTTP, cached across
+    invocations) and falls back to the Secrets Manager SDK when it is not installed.
+
     Args:
         secret_name: Name of the secret in Secrets Manager
 
@@ -38,8 +206,13 @@ def get_secret(secret_name: str) -> str:
     if secret_name in _secrets_cache:
         return _secrets_cache[secret_name]
 
+    secret_value = _get_secret_from_extension(secret_name)
+    if secret_value is not None:
+        _secrets_cache[secret_name] = secret_value
+        return secret_value
+
     try:
-        response = secrets_client.get_secret_value(SecretId=secret_name)
+        response = _get_secrets_client().get_secret_value(SecretId=secret_name)
         secret_value = response['SecretString']
         _secrets_cache[secret_name] = secret_value
         return secret_value
@@ -48,6 +221,87 @@ def get_secret(secret_name: str) -> str:
         raise
 
 
+def get_secrets(*secret_names: str) -> list[str]:
+    """Retrieve several secrets concurrently.
+
+    Args:
+        *secret_names: Names of the secrets in Secrets Manager
+
+    Returns:
+        Secret values in the same order as the names
+    """
+    missing = [name for name in secret_names if name not in _secrets_cache]
+    if len(missing) > 1:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            list(executor.map(get_secret, missing))
+    return [get_secret(name) for name in secret_names]
+
+
+def get_processor(api_key: str, model: str) -> RecipeProcessor:
+    """Get a cached RecipeProcessor for the given credentials and model.
+
+    Args:
+        api_key: Anthropic API key
+        model: Claude model name
+
+    Returns:
+        RecipeProcessor instance reused across warm invocations
+    """
+    cache_key = (api_key, model)
+    if cache_key not in _processor_cache:
+        _processor_cache[cache_key] = RecipeProcessor(
+            api_key=api_key,
+            model=model,
+            apply_formatting=True,
+            http_client=_anthropic_http_client
+        )
+    return _processor_cache[cache_key]
+
+
+def get_notion_client(notion_api_key: str, notion_db_id: str) -> NotionRecipeClient:
+    """Get a cached NotionRecipeClient for the given credentials and database.
+
+    Args:
+        notion_api_key: Notion API key
+        notion_db_id: Notion database ID
+
+    Returns:
+        NotionRecipeClient instance reused across warm invocations
+    """
+    cache_key = (notion_api_key, notion_db_id)
+    if cache_key not in _notion_client_cache:
+        _notion_client_cache[cache_key] = NotionRecipeClient(
+            api_key=notion_api_key,
+            database_id=notion_db_id,
+            http_client=httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=MAX_WORKERS)
+            )
+        )
+    return _notion_client_cache[cache_key]
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_whitelist(whitelist: str) -> tuple[frozenset[str], frozenset[str]]:
+    """Parse a comma-separated whitelist into exact addresses and wildcard domains.
+
+    Args:
+        whitelist: Comma-separated list of allowed emails (supports *@domain wildcards)
+
+    Returns:
+        Tuple of (exact_emails, wildcard_domains)
+    """
+    exact = set()
+    domains = set()
+    for allowed in whitelist.split(','):
+        allowed = allowed.strip().lower()
+        if allowed.startswith('*@'):
+            domains.add(allowed[2:])
+        else:
+            exact.add(allowed)
+    return frozenset(exact), frozenset(domains)
+
+
 def is_email_whitelisted(sender_email: str, whitelist: str) -> bool:
     """Check if sender email is in whitelist.
 
@@ -58,19 +312,15 @@ def is_email_whitelisted(sender_email: str, whitelist: str) -> bool:
     Returns:
         True if email is whitelisted, False otherwise
     """
+    exact, domains = _parse_whitelist(whitelist)
     sender_email = sender_email.lower().strip()
-    allowed_emails = [email.strip().lower() for email in whitelist.split(',')]
 
-    for allowed in allowed_emails:
-        if allowed == sender_email:
-            return True
-        # Support wildcard domain matching: *@example.com
-        if allowed.startswith('*@'):
-            domain = allowed[2:]
-            if sender_email.endswith(f'@{domain}'):
-                return True
+    if sender_email in exact:
+        return True
 
-    return False
+    # Support wildcard domain matching: *@example.com
+    _, at, domain = sender_email.rpartition('@')
+    return bool(at) and domain in domains
 
 
 def extract_sender_email(from_header: str) -> str:
@@ -82,13 +332,13 @@ def extract_sender_email(from_header: str) -> str:
     Returns:
         Email address only
     """
-    match = re.search(r'<(.+?)>', from_header)
+    match = _FROM_RE.search(from_header)
     if match:
         return match.group(1)
     return from_header
 
 
-def extract_urls_from_text(text: str) -> List[str]:
+def extract_urls_from_text(text: str) -> list[str]:
     """Extract URLs from email text.
 
     Args:
@@ -97,8 +347,66 @@ def extract_urls_from_text(text: str) -> List[str]:
     Returns:
         List of URLs found in text
     """
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    return re.findall(url_pattern, text)
+    return _URL_RE.findall(text)
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize a URL for duplicate detection.
+
+    Drops the fragment and utm_* tracking parameters and lowercases the host.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Canonical form of the URL
+    """
+    parts = urlsplit(url)
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith('utm_')
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+
+def deduplicate_urls(urls: list[str]) -> list[str]:
+    """Remove duplicate URLs, keeping the first occurrence of each.
+
+    Args:
+        urls: URLs in the order they appear in the email
+
+    Returns:
+        URLs with duplicates (including fragment/tracking variants) removed
+    """
+    unique: dict[str, str] = {}
+    for url in urls:
+        unique.setdefault(_canonical_url(url), url)
+    return list(unique.values())
+
+
+def read_from_header_from_s3(bucket: str, key: str) -> str | None:
+    """Read the From header with a ranged GET of the start of the email.
+
+    Lets unlisted senders be rejected without downloading their attachments.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+
+    Returns:
+        From header value, or None if the header block does not fit in the range
+    """
+    response = s3_client.get_object(
+        Bucket=bucket, Key=key, Range=f'bytes=0-{S3_HEADER_RANGE_BYTES - 1}'
+    )
+    head = response['Body'].read()
+
+    # Only trust the headers if the blank line ending them (or the whole object) was read
+    if len(head) >= S3_HEADER_RANGE_BYTES and b'\n\n' not in head and b'\r\n\r\n' not in head:
+        return None
+
+    headers = BytesHeaderParser(policy=policy.default).parsebytes(head)
+    return str(headers.get('From', ''))
 
 
 def parse_email_from_s3(bucket: str, key: str) -> email.message.Message:
@@ -113,63 +421,111 @@ def parse_email_from_s3(bucket: str, key: str) -> email.message.Message:
     """
     logger.info(f"Downloading email from s3://{bucket}/{key}")
     response = s3_client.get_object(Bucket=bucket, Key=key)
-    email_bytes = response['Body'].read()
 
-    # Parse email
-    msg = BytesParser(policy=policy.default).parsebytes(email_bytes)
-    return msg
+    # Parse email incrementally as it streams in, without buffering the whole object
+    parser = BytesFeedParser(policy=policy.default)
+    body = response['Body']
+    for chunk in iter(lambda: body.read(S3_READ_CHUNK_SIZE), b''):
+        parser.feed(chunk)
+    return parser.close()
 
 
-def extract_attachments(msg: email.message.Message) -> List[Dict[str, Any]]:
-    """Extract image attachments from email.
+def extract_email_parts(msg: email.message.Message) -> tuple[list[dict[str, Any]], str]:
+    """Extract image attachments and plain text body in a single pass over the email.
 
     Args:
         msg: Parsed email message
 
     Returns:
-        List of attachment dicts with 'filename' and 'data' keys
+        Tuple of (attachments, body) where attachments is a list of dicts with
+        'filename', 'data', 'raw_b64' and 'content_type' keys, and body is the
+        plain text. For base64-encoded parts 'data' is None and 'raw_b64' holds
+        the undecoded payload.
     """
     attachments = []
+    body_parts = []
+    is_multipart = msg.is_multipart()
 
     for part in msg.walk():
+        maintype = part.get_content_maintype()
+
         # Look for image attachments
-        if part.get_content_maintype() == 'image':
+        if maintype == 'image':
             filename = part.get_filename() or 'recipe_image.jpg'
-            data = part.get_payload(decode=True)
 
-            logger.info(f"Found image attachment: {filename} ({len(data)} bytes)")
+            # Keep base64 payloads encoded; they are only decoded if the image
+            # has to be resized, otherwise they go to the API as-is
+            if part.get('Content-Transfer-Encoding', '').strip().lower() == 'base64':
+                raw_b64 = ''.join(part.get_payload(decode=False).split())
+                data = None
+                size = len(raw_b64) * 3 // 4
+            else:
+                raw_b64 = None
+                data = part.get_payload(decode=True)
+                size = len(data)
+
+            logger.info(f"Found image attachment: {filename} ({size} bytes)")
             attachments.append({
                 'filename': filename,
                 'data': data,
+                'raw_b64': raw_b64,
                 'content_type': part.get_content_type()
             })
+        elif not is_multipart or part.get_content_type() == 'text/plain':
+            # Single-part emails use their whole payload as the body
+            payload = part.get_payload(decode=True)
+            if payload:
+                body_parts.append(payload.decode('utf-8', errors='ignore'))
 
-    return attachments
+    return attachments, ''.join(body_parts)
 
 
-def extract_email_body(msg: email.message.Message) -> str:
-    """Extract plain text body from email.
+def extract_email_parts_fast(email_bytes: bytes) -> tuple[list[dict[str, Any]], str]:
+    """Extract image attachments and plain text body using fast_mail_parser.
 
     Args:
-        msg: Parsed email message
+        email_bytes: Raw RFC822 email
 
     Returns:
-        Email body as plain text
+        Tuple of (attachments, body) in the same shape as extract_email_parts()
     """
-    body = ""
+    parsed = fast_mail_parser.parse_email(email_bytes)
 
-    if msg.is_multipart():
-        for part in msg.walk():
-            content_type = part.get_content_type()
-            if content_type == 'text/plain':
-                body += part.get_payload(decode=True).decode('utf-8', errors='ignore')
-    else:
-        body = msg.get_payload(decode=True).decode('utf-8', errors='ignore')
+    attachments = []
+    for part in parsed.attachments:
+        if not part.mimetype.startswith('image/'):
+            continue
+        filename = part.filename or 'recipe_image.jpg'
+        logger.info(f"Found image attachment: {filename} ({len(part.content)} bytes)")
+        attachments.append({
+            'filename': filename,
+            'data': bytes(part.content),
+            'raw_b64': None,
+            'content_type': part.mimetype
+        })
+
+    return attachments, ''.join(parsed.text_plain)
+
+
+def load_email_parts_from_s3(bucket: str, key: str) -> tuple[list[dict[str, Any]], str]:
+    """Download an email from S3 and extract its image attachments and body.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+
+    Returns:
+        Tuple of (attachments, body)
+    """
+    if USE_FAST_MAIL_PARSER:
+        logger.info(f"Downloading email from s3://{bucket}/{key}")
+        email_bytes = s3_client.get_object(Bucket=bucket, Key=key)['Body'].read()
+        return extract_email_parts_fast(email_bytes)
 
-    return body
+    return extract_email_parts(parse_email_from_s3(bucket, key))
 
 
-def process_recipe_from_attachment(attachment: Dict[str, Any], api_key: str,
+def process_recipe_from_attachment(attachment: dict[str, Any], api_key: str,
                                    notion_api_key: str, notion_db_id: str) -> str:
     """Process recipe from image attachment.
 
@@ -182,17 +538,10 @@ def process_recipe_from_attachment(attachment: Dict[str, Any], api_key: str,
     Returns:
         Notion page URL
     """
-    import tempfile
-    from pathlib import Path
-
-    # Import recipe-duck modules
-    sys.path.insert(0, '/opt/python')  # Lambda layer path
-    from recipe_duck.processor import RecipeProcessor
-    from recipe_duck.notion_client import NotionRecipeClient
-
-    # Determine file extension for temp file
+    # Determine file extension for media type detection
     filename = attachment['filename'].lower()
     data = attachment['data']
+    raw_b64 = attachment.get('raw_b64')
 
     # Use original extension if available, preserve HEIC/HEIF
     if filename.endswith('.heic'):
@@ -206,37 +555,35 @@ def process_recipe_from_attachment(attachment: Dict[str, Any], api_key: str,
 
     logger.info(f"Processing image: {attachment['filename']} (format: {suffix})")
 
-    # Write attachment to temporary file with correct extension
-    # PIL with pillow-heif will handle HEIC natively
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
-        tmp_file.write(data)
-        tmp_path = Path(tmp_file.name)
+    processor = get_processor(api_key, DEFAULT_MODEL)
 
-    try:
-        # Process image with verbose logging for CloudWatch
-        logger.info(f"Processing image: {attachment['filename']}")
-        processor = RecipeProcessor(
-            api_key=api_key,
-            model=DEFAULT_MODEL,
-            apply_formatting=True
-        )
-        markdown = processor.process_image(tmp_path, verbose=True)
+    # Send the email's base64 payload straight to the API when the image would
+    # not be re-encoded anyway, skipping a decode/encode round-trip
+    if raw_b64 and suffix not in ('.heic', '.heif') and (
+        not RESIZE_IMAGES or len(raw_b64) * 3 // 4 < RESIZE_MIN_BYTES
+    ):
+        markdown = processor.process_image_base64(raw_b64, suffix=suffix, verbose=True)
+    else:
+        if data is None:
+            data = base64.b64decode(raw_b64)
 
-        # Push to Notion with verbose logging
-        logger.info("Pushing recipe to Notion")
-        notion_client = NotionRecipeClient(
-            api_key=notion_api_key,
-            database_id=notion_db_id
-        )
-        page_url = notion_client.push_recipe(markdown, verbose=True)
+        if RESIZE_IMAGES:
+            resized, suffix = downscale_image(data, suffix)
+            if resized is not data:
+                logger.info(f"Downscaled image from {len(data)} to {len(resized)} bytes")
+                data = resized
 
-        logger.info(f"Recipe created successfully: {page_url}")
-        return page_url
+        # Process image bytes in memory (PIL with pillow-heif handles HEIC natively)
+        # with verbose logging for CloudWatch
+        markdown = processor.process_image_bytes(data, suffix=suffix, verbose=True)
 
-    finally:
-        # Cleanup temp file
-        if tmp_path.exists():
-            tmp_path.unlink()
+    # Push to Notion with verbose logging
+    logger.info("Pushing recipe to Notion")
+    notion_client = get_notion_client(notion_api_key, notion_db_id)
+    page_url = notion_client.push_recipe(markdown, verbose=True)
+
+    logger.info(f"Recipe created successfully: {page_url}")
+    return page_url
 
 
 def process_recipe_from_url(url: str, api_key: str,
@@ -252,33 +599,86 @@ def process_recipe_from_url(url: str, api_key: str,
     Returns:
         Notion page URL
     """
-    # Import recipe-duck modules
-    sys.path.insert(0, '/opt/python')  # Lambda layer path
-    from recipe_duck.processor import RecipeProcessor
-    from recipe_duck.notion_client import NotionRecipeClient
-
     # Process URL with verbose logging for CloudWatch
     logger.info(f"Processing URL: {url}")
-    processor = RecipeProcessor(
-        api_key=api_key,
-        model=DEFAULT_MODEL,
-        apply_formatting=True
-    )
+    processor = get_processor(api_key, DEFAULT_MODEL)
     markdown = processor.process_url(url, verbose=True)
 
     # Push to Notion with verbose logging
     logger.info("Pushing recipe to Notion")
-    notion_client = NotionRecipeClient(
-        api_key=notion_api_key,
-        database_id=notion_db_id
-    )
+    notion_client = get_notion_client(notion_api_key, notion_db_id)
     page_url = notion_client.push_recipe(markdown, verbose=True)
 
     logger.info(f"Recipe created successfully: {page_url}")
     return page_url
 
 
-def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+def _delete_email(bucket: str, key: str) -> None:
+    """Delete a processed email from S3, logging rather than raising on failure.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+    """
+    try:
+        s3_client.delete_object(Bucket=bucket, Key=key)
+    except Exception as e:
+        logger.error(f"Failed to delete email s3://{bucket}/{key}: {str(e)}")
+
+
+def delete_email_in_background(bucket: str, key: str) -> None:
+    """Delete a processed email from S3 without blocking the handler response.
+
+    The delete runs on a daemon thread; if the execution environment is frozen
+    before it completes, it resumes on the next invocation, and the bucket
+    lifecycle rule removes any email that is never deleted.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+    """
+    logger.info(f"Deleting email from S3: s3://{bucket}/{key}")
+    threading.Thread(target=_delete_email, args=(bucket, key), daemon=True).start()
+
+
+def process_recipe_task(source_type: str, source: str, item: Any, api_key: str,
+                        notion_api_key: str, notion_db_id: str) -> dict[str, Any]:
+    """Process a single attachment or URL, capturing failures as a result entry.
+
+    Args:
+        source_type: 'image' for attachments, 'url' for URLs
+        source: Attachment filename or URL, used for reporting
+        item: Attachment dict or URL string
+        api_key: Anthropic API key
+        notion_api_key: Notion API key
+        notion_db_id: Notion database ID
+
+    Returns:
+        Result dict with type, source, status, and notion_url or error
+    """
+    try:
+        if source_type == 'image':
+            page_url = process_recipe_from_attachment(item, api_key, notion_api_key, notion_db_id)
+        else:
+            page_url = process_recipe_from_url(item, api_key, notion_api_key, notion_db_id)
+        return {
+            'type': source_type,
+            'source': source,
+            'status': 'success',
+            'notion_url': page_url
+        }
+    except Exception as e:
+        label = 'attachment' if source_type == 'image' else 'URL'
+        logger.error(f"Failed to process {label} {source}: {str(e)}")
+        return {
+            'type': source_type,
+            'source': source,
+            'status': 'error',
+            'error': str(e)
+        }
+
+
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """Main Lambda handler for processing recipe emails.
 
     Args:
@@ -289,7 +689,8 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         Response dict with status code and message
     """
     try:
-        logger.info(f"Received event: {json.dumps(event)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received event: %s", _dumps(event))
 
         # Extract S3 bucket and key from event
         record = event['Records'][0]
@@ -297,16 +698,22 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         key = record['s3']['object']['key']
 
         # Get secrets
-        anthropic_key = get_secret(os.environ['ANTHROPIC_API_KEY_SECRET'])
-        notion_key = get_secret(os.environ['NOTION_API_KEY_SECRET'])
-        notion_db = get_secret(os.environ['NOTION_DATABASE_ID_SECRET'])
-        whitelist = get_secret(os.environ['EMAIL_WHITELIST_SECRET'])
+        anthropic_key, notion_key, notion_db, whitelist = get_secrets(
+            os.environ['ANTHROPIC_API_KEY_SECRET'],
+            os.environ['NOTION_API_KEY_SECRET'],
+            os.environ['NOTION_DATABASE_ID_SECRET'],
+            os.environ['EMAIL_WHITELIST_SECRET']
+        )
 
-        # Parse email from S3
-        msg = parse_email_from_s3(bucket, key)
+        # Read sender from the email headers before downloading the full email
+        msg = None
+        from_header = read_from_header_from_s3(bucket, key)
+        if from_header is None:
+            # Headers did not fit in the ranged read; parse the full email instead
+            msg = parse_email_from_s3(bucket, key)
+            from_header = msg.get('From', '')
 
         # Extract sender and validate whitelist
-        from_header = msg.get('From', '')
         sender_email = extract_sender_email(from_header)
         logger.info(f"Email from: {sender_email}")
 
@@ -314,72 +721,43 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             logger.warning(f"Email from {sender_email} not in whitelist. Rejecting.")
             return {
                 'statusCode': 403,
-                'body': json.dumps({'message': 'Sender not whitelisted'})
+                'body': _dumps({'message': 'Sender not whitelisted'})
             }
 
         logger.info(f"Email from {sender_email} is whitelisted. Processing...")
 
         # Extract attachments and URLs
-        attachments = extract_attachments(msg)
-        body = extract_email_body(msg)
-        urls = extract_urls_from_text(body)
+        if msg is None:
+            attachments, body = load_email_parts_from_s3(bucket, key)
+        else:
+            attachments, body = extract_email_parts(msg)
+        urls = deduplicate_urls(extract_urls_from_text(body))
 
         logger.info(f"Found {len(attachments)} image attachments and {len(urls)} URLs")
 
-        results = []
+        # Process attachments and URLs concurrently; results keep email order
+        tasks = [('image', attachment['filename'], attachment) for attachment in attachments]
+        tasks += [('url', url, url) for url in urls]
 
-        # Process image attachments
-        for attachment in attachments:
-            try:
-                page_url = process_recipe_from_attachment(
-                    attachment, anthropic_key, notion_key, notion_db
-                )
-                results.append({
-                    'type': 'image',
-                    'source': attachment['filename'],
-                    'status': 'success',
-                    'notion_url': page_url
-                })
-            except Exception as e:
-                logger.error(f"Failed to process attachment {attachment['filename']}: {str(e)}")
-                results.append({
-                    'type': 'image',
-                    'source': attachment['filename'],
-                    'status': 'error',
-                    'error': str(e)
-                })
-
-        # Process URLs
-        for url in urls:
-            try:
-                page_url = process_recipe_from_url(
-                    url, anthropic_key, notion_key, notion_db
-                )
-                results.append({
-                    'type': 'url',
-                    'source': url,
-                    'status': 'success',
-                    'notion_url': page_url
-                })
-            except Exception as e:
-                logger.error(f"Failed to process URL {url}: {str(e)}")
-                results.append({
-                    'type': 'url',
-                    'source': url,
-                    'status': 'error',
-                    'error': str(e)
-                })
+        results = []
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(tasks))) as executor:
+                results = list(executor.map(
+                    lambda task: process_recipe_task(
+                        *task, anthropic_key, notion_key, notion_db
+                    ),
+                    tasks
+                ))
 
         # Cleanup: Delete email from S3
-        if os.environ.get('DELETE_EMAILS_AFTER_PROCESSING', 'true').lower() == 'true':
-            logger.info(f"Deleting email from S3: s3://{bucket}/{key}")
-            s3_client.delete_object(Bucket=bucket, Key=key)
+        if DELETE_EMAILS_AFTER_PROCESSING:
+            delete_email_in_background(bucket, key)
 
         # Return summary
         success_count = sum(1 for r in results if r['status'] == 'success')
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': _dumps({
                 'message': f'Processed {success_count}/{len(results)} recipes successfully',
                 'results': results
             })
@@ -389,7 +767,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         logger.error(f"Lambda execution failed: {str(e)}", exc_info=True)
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': _dumps({
                 'message': 'Internal error',
                 'error': str(e)
             })
@@ -8,13 +8,17 @@ from typing import Optional
 from urllib.parse import urlparse
 from dotenv import load_dotenv
 
-from recipe_duck.processor import RecipeProcessor
+from recipe_duck.processor import RecipeProcessor, default_cache_dir
 from recipe_duck.notion_client import NotionRecipeClient
 from recipe_duck.config import PrintURLConfig
 
 # Load .env file if present
 load_dotenv()
 
+# Filename cleanup patterns
+_NONWORD_RE = re.compile(r"[^\w\-_]")
+_COLLAPSE_RE = re.compile(r"[_-]+")
+
 
 def is_url(input_str: str) -> bool:
     """Check if input string is a URL.
@@ -50,8 +54,8 @@ def generate_filename_from_url(url: str) -> str:
             break
 
     # Clean filename - remove special chars
-    filename = re.sub(r"[^\w\-_]", "_", filename)
-    filename = re.sub(r"[_-]+", "_", filename).strip("_")
+    filename = _NONWORD_RE.sub("_", filename)
+    filename = _COLLAPSE_RE.sub("_", filename).strip("_")
 
     return filename
 
@@ -99,6 +103,16 @@ def generate_filename_from_url(url: str) -> str:
     is_flag=True,
     help="Disable deterministic formatting (units, fractions, numbering)",
 )
+@click.option(
+    "--no-resize",
+    is_flag=True,
+    help="Send images at original size instead of downscaling large photos",
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Reuse fetched pages and AI responses for identical inputs (stored in ~/.cache/recipe_duck)",
+)
 @click.option(
     "--verbose",
     "-v",
@@ -140,6 +154,8 @@ def main(
     notion_api_key: Optional[str],
     notion_database_id: Optional[str],
     no_format: bool,
+    no_resize: bool,
+    cache: bool,
     verbose: bool,
     debug: bool,
     debug_dir: Optional[Path],
@@ -225,6 +241,8 @@ def main(
         apply_formatting=not no_format,
         print_url_config=print_url_config,
         youtube_api_key=youtube_api_key,
+        resize_images=not no_resize,
+        cache_dir=default_cache_dir() if cache else None,
     )
 
     try:
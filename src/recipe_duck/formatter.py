@@ -1,11 +1,55 @@
 """Post-processing formatter for deterministic recipe output."""
 
+import functools
 import re
+from collections.abc import Iterable, Iterator
 from fractions import Fraction
-from typing import List, Optional
+from typing import Optional
 
 from recipe_duck.config import FormattingConfig, DEFAULT_CONFIG
 
+# Cheap prefilter: the unit pattern can only match lines containing a digit
+_HAS_DIGIT = re.compile(r'\d')
+
+
+def _strip_step_prefix(text: str) -> str:
+    """Remove a leading step number ("1." or "1)") and dash bullet from a stripped line.
+
+    Args:
+        text: Instruction line with surrounding whitespace removed
+
+    Returns:
+        Instruction content without numbering or bullet
+    """
+    i = 0
+    while i < len(text) and text[i].isdecimal():
+        i += 1
+    if i and text[i:i + 1] in (".", ")"):
+        text = text[i + 1:].lstrip()
+
+    without_bullet = text.removeprefix("- ")
+    if without_bullet is not text:
+        text = without_bullet.strip()
+    return text
+
+
+@functools.lru_cache(maxsize=256)
+def _needs_plural(quantity: str) -> bool:
+    """Check whether a quantity calls for a plural unit.
+
+    Args:
+        quantity: Quantity string, e.g. "2", "1/2" or "3.5"
+
+    Returns:
+        True if the quantity is greater than one, False otherwise or if it can't be parsed
+    """
+    try:
+        if '/' in quantity:
+            return Fraction(quantity) > 1
+        return float(quantity) > 1
+    except (ValueError, ZeroDivisionError):
+        return False
+
 
 class RecipeFormatter:
     """Formats recipe markdown with deterministic rules."""
@@ -18,6 +62,30 @@ class RecipeFormatter:
         """
         self.config = config or DEFAULT_CONFIG
 
+        # Single-character (unicode) fractions are applied in one str.translate pass;
+        # multi-character ones (decimals) share a single compiled alternation
+        fractions = self.config.fraction_normalizations
+        self._fraction_table = str.maketrans(
+            {frac: ascii_frac for frac, ascii_frac in fractions.items() if len(frac) == 1}
+        )
+        # Pure-ASCII lines can skip the translate unless the table maps ASCII characters
+        self._translate_ascii = any(frac.isascii() for frac in fractions if len(frac) == 1)
+        self._fraction_replacements = {
+            frac: ascii_frac for frac, ascii_frac in fractions.items() if len(frac) > 1
+        }
+        self._fraction_pattern = None
+        if self._fraction_replacements:
+            decimals = sorted(self._fraction_replacements, key=len, reverse=True)
+            self._fraction_pattern = re.compile('|'.join(re.escape(frac) for frac in decimals))
+
+        # Match quantity + unit, e.g. "2 tbsp", "1/2 tsp", "3.5 oz". Longer units come
+        # first so "fl oz" wins over "f" in the single alternation.
+        units = sorted(self.config.unit_normalizations, key=len, reverse=True)
+        self._unit_pattern = re.compile(
+            r'\b(\d+(?:[\/\.\d]*)?)\s*(' + '|'.join(re.escape(abbr) for abbr in units) + r')s?\b',
+            re.IGNORECASE,
+        )
+
     def format(self, markdown: str) -> str:
         """Apply all formatting rules to recipe markdown.
 
@@ -27,40 +95,54 @@ class RecipeFormatter:
         Returns:
             Formatted markdown with deterministic rules applied
         """
+        return "\n".join(self._format_lines(markdown.split("\n")))
+
+    def format_and_renumber(self, markdown: str) -> str:
+        """Apply format() and then renumber_instructions() in a single pass.
+
+        Each line is formatted and renumbered as it streams through, so the
+        intermediate markdown string is never built.
+
+        Args:
+            markdown: Raw markdown from AI extraction
+
+        Returns:
+            Same result as renumber_instructions(format(markdown))
+        """
+        if not markdown:
+            return markdown
+
+        return "\n".join(self._renumber_lines(self._format_lines(markdown.split("\n"))))
+
+    def _format_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Apply the line formatting rules, yielding one output line per input line.
+
+        Args:
+            lines: Markdown lines
+
+        Yields:
+            Formatted lines
+        """
         # Process line by line to maintain structure
-        lines = markdown.split("\n")
-        formatted_lines = []
         in_ingredients = False
         in_instructions = False
 
         for line in lines:
-            if line.strip().startswith("## Ingredients"):
-                in_ingredients = True
-                in_instructions = False
-                formatted_lines.append(line)
-                continue
-            elif line.strip().startswith("## Instructions"):
-                in_ingredients = False
-                in_instructions = True
-                formatted_lines.append(line)
-                continue
-            elif line.strip().startswith("##") or line.strip().startswith("#"):
-                in_ingredients = False
-                in_instructions = False
-                formatted_lines.append(line)
-                continue
+            stripped = line.strip()
 
-            # Apply section-specific formatting
-            if in_ingredients and line.strip():
-                formatted_line = self._format_ingredient_line(line)
-            elif in_instructions and line.strip():
-                formatted_line = self._format_instruction_line(line)
+            # Any heading switches section; only Ingredients/Instructions get formatting
+            if stripped.startswith("#"):
+                in_ingredients = stripped.startswith("## Ingredients")
+                in_instructions = stripped.startswith("## Instructions")
+                yield line
+            elif not stripped:
+                yield line
+            elif in_ingredients:
+                yield self._format_ingredient_line(line)
+            elif in_instructions:
+                yield self._format_instruction_line(line)
             else:
-                formatted_line = line
-
-            formatted_lines.append(formatted_line)
-
-        return "\n".join(formatted_lines)
+                yield line
 
     def _format_ingredient_line(self, line: str) -> str:
         """Format an ingredient line with deterministic rules.
@@ -71,15 +153,16 @@ class RecipeFormatter:
         Returns:
             Formatted ingredient line
         """
-        # Ensure bullet point
-        stripped = line.lstrip()
-        if self.config.enforce_ingredient_bullets and not stripped.startswith("-"):
-            # Add bullet if it's not empty and not already bulleted
-            if stripped and not stripped.startswith("*"):
-                line = "- " + stripped
-            elif stripped.startswith("*"):
-                # Convert asterisk to dash
+        # Ensure bullet point, dispatching on the first non-space character
+        if self.config.enforce_ingredient_bullets:
+            stripped = line.lstrip()
+            marker = stripped[:1]
+            if marker == "*" or stripped.startswith("+ "):
+                # Convert asterisk/plus bullets to dash
                 line = "- " + stripped[1:].lstrip()
+            elif marker and marker != "-":
+                # Add bullet if it's not empty and not already bulleted
+                line = "- " + stripped
 
         # Normalize fractions
         line = self._normalize_fractions(line)
@@ -101,16 +184,12 @@ class RecipeFormatter:
         # Ensure numbered list format
         stripped = line.lstrip()
         if self.config.enforce_numbered_steps and stripped:
-            # Check if it already starts with a number followed by period or )
-            if not re.match(r"^\d+[\.\)]\s", stripped):
-                # If it starts with a bullet or other marker, remove it
-                if stripped.startswith("-") or stripped.startswith("*"):
-                    stripped = stripped[1:].lstrip()
-                # Don't auto-number yet - that requires context of line position
-                # Just ensure clean format for now
-                line = stripped
-            else:
-                line = stripped
+            # If it starts with a bullet marker, remove it (numbered steps start
+            # with a digit, so they never match). Don't auto-number yet - that
+            # requires context of line position; just ensure clean format for now
+            if stripped[0] in "-*" or stripped.startswith("+ "):
+                stripped = stripped[1:].lstrip()
+            line = stripped
 
         return line
 
@@ -124,8 +203,12 @@ class RecipeFormatter:
             Text with normalized fractions
         """
         result = text
-        for unicode_frac, ascii_frac in self.config.fraction_normalizations.items():
-            result = result.replace(unicode_frac, ascii_frac)
+        if self._translate_ascii or not text.isascii():
+            result = text.translate(self._fraction_table)
+        if self._fraction_pattern:
+            result = self._fraction_pattern.sub(
+                lambda match: self._fraction_replacements[match.group(0)], result
+            )
         return result
 
     def _normalize_units(self, text: str) -> str:
@@ -137,47 +220,32 @@ class RecipeFormatter:
         Returns:
             Text with normalized units
         """
-        result = text
+        if not _HAS_DIGIT.search(text):
+            return text
 
-        # Pattern to match quantity + unit
-        # Matches things like "2 tbsp", "1/2 tsp", "3.5 oz", etc.
-        pattern = r'\b(\d+(?:[\/\.\d]*)?)\s*(' + '|'.join(
-            re.escape(abbr) for abbr in self.config.unit_normalizations.keys()
-        ) + r')s?\b'
+        return self._unit_pattern.sub(self._replace_unit, text)
 
-        def replace_unit(match):
-            quantity = match.group(1)
-            unit_abbr = match.group(2).lower()
+    def _replace_unit(self, match: re.Match[str]) -> str:
+        """Expand a matched quantity + unit abbreviation to the full unit name.
 
-            # Get full unit name
-            full_unit = self.config.unit_normalizations.get(
-                unit_abbr,
-                unit_abbr
-            )
+        Args:
+            match: Match of the unit pattern (quantity, unit abbreviation)
 
-            # Handle pluralization if enabled
-            if self.config.pluralize_units:
-                try:
-                    # Parse quantity to determine if plural
-                    if '/' in quantity:
-                        # Fraction
-                        frac = Fraction(quantity)
-                        needs_plural = frac > 1
-                    else:
-                        # Decimal or integer
-                        num = float(quantity)
-                        needs_plural = num > 1
-
-                    if needs_plural and full_unit in self.config.unit_plurals:
-                        full_unit = self.config.unit_plurals[full_unit]
-                except (ValueError, ZeroDivisionError):
-                    # If we can't parse, keep singular
-                    pass
-
-            return f"{quantity} {full_unit}"
-
-        result = re.sub(pattern, replace_unit, result, flags=re.IGNORECASE)
-        return result
+        Returns:
+            Quantity followed by the full (optionally pluralized) unit name
+        """
+        quantity = match.group(1)
+        unit_abbr = match.group(2).lower()
+        config = self.config
+
+        # Get full unit name
+        full_unit = config.unit_normalizations.get(unit_abbr, unit_abbr)
+
+        # Handle pluralization if enabled (quantities repeat, so the parse is cached)
+        if config.pluralize_units and _needs_plural(quantity):
+            full_unit = config.unit_plurals.get(full_unit, full_unit)
+
+        return f"{quantity} {full_unit}"
 
     def renumber_instructions(self, markdown: str) -> str:
         """Renumber instruction steps to ensure sequential numbering with blank lines between.
@@ -188,8 +256,17 @@ class RecipeFormatter:
         Returns:
             Markdown with sequentially numbered instructions and blank lines
         """
-        lines = markdown.split("\n")
-        result_lines = []
+        return "\n".join(self._renumber_lines(markdown.split("\n")))
+
+    def _renumber_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Renumber instruction steps line by line.
+
+        Args:
+            lines: Markdown lines
+
+        Yields:
+            Lines with sequentially numbered instructions and blank lines between steps
+        """
         in_instructions = False
         step_number = 1
 
@@ -199,33 +276,27 @@ class RecipeFormatter:
             if stripped.startswith("## Instructions"):
                 in_instructions = True
                 step_number = 1
-                result_lines.append(line)
+                yield line
                 continue
             elif stripped.startswith("##") or stripped.startswith("#"):
                 in_instructions = False
-                result_lines.append(line)
+                yield line
                 continue
             elif stripped == "---":
                 # Horizontal rules always end the instructions section and pass through
                 in_instructions = False
-                result_lines.append(line)
+                yield line
                 continue
 
             if in_instructions and stripped:
                 # Remove any existing numbering or bullets
-                # Match existing number patterns
-                content = re.sub(r'^\d+[\.\)]\s*', '', stripped)
-                # Also handle dash bullets
-                if content.startswith("- "):
-                    content = content[2:].strip()
+                content = _strip_step_prefix(stripped)
 
                 if content:  # Only number non-empty lines
                     # Add blank line before step if not the first step
                     if step_number > 1:
-                        result_lines.append("")
-                    result_lines.append(f"{step_number}. {content}")
+                        yield ""
+                    yield f"{step_number}. {content}"
                     step_number += 1
             else:
-                result_lines.append(line)
-
-        return "\n".join(result_lines)
+                yield line
@@ -1,39 +1,433 @@
 """Notion database integration for recipe storage."""
 
+import functools
+import importlib.util
 import os
+import random
 import re
-from typing import Optional
-
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
 from notion_client import Client
+from notion_client.errors import HTTPResponseError, NotionClientErrorBase
+
+# notion-client 3.x retries on its own; disable that so attempts don't multiply
+_SDK_OPTIONS: dict[str, Any]
+try:
+    from notion_client import RetryOptions  # noqa: F401
+    _SDK_OPTIONS = {"retry": False}
+except ImportError:
+    _SDK_OPTIONS = {}
+
+# HTTP/2 support (httpx needs the optional h2 package for it)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Patterns used by parse_recipe_markdown, compiled once at import time
+_METADATA_RE = re.compile(r'\*\*(Prep Time|Cook Time|Total Time|Servings):\*\*\s*([^\n*]+)')
+
+# Section headings recognised by _scan_markdown
+_SECTIONS = ("Ingredients", "Directions", "Photos", "Links", "Notes", "Nutrition")
+_SECTION_HEADING_RE = re.compile(rf'##\s+({"|".join(_SECTIONS)})\s*$')
+_SECTION_END_RE = re.compile(r'---|##\s[A-Z]')
+
+# Fields of the "*Cuisine: ... | Protein: ... | ... | Cook Time: ...*" line, in order
+_PROPERTY_LABELS = ("Cuisine", "Protein", "Course", "Method", "Effort", "Rating", "Cook Time")
+
+# Notion's validation error for a property the database lacks, e.g. "Cuisine is not a property that exists."
+_MISSING_PROPERTY_RE = re.compile(r'([^\n]*?)\s*is not a property that exists')
+
+# Printed in verbose mode when a page had to be created without its properties
+_PROPERTY_SETUP_HINT = (
+    "💡 To use properties, add these fields to your Notion database:\n"
+    "   - Cuisine (multi-select)\n"
+    "   - Protein (multi-select)\n"
+    "   - Course (multi-select)\n"
+    "   - Method (multi-select)\n"
+    "   - Effort (select)\n"
+    "   - Rating (select)"
+)
+
+# Multi-select page properties and the recipe data keys they come from
+_MULTI_SELECT_PROPERTIES = (("Cuisine", "cuisine"), ("Protein", "protein"), ("Course", "course"), ("Method", "method"))
+
+# Notion accepts at most 100 child blocks per create/append request
+MAX_BLOCKS_PER_REQUEST = 100
+
+# Rate limits and transient server errors worth retrying for idempotent reads
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Page creates and block appends aren't idempotent: a 500/502/504 can arrive after
+# the write went through, so only statuses meaning the request wasn't processed are
+# retried, to avoid duplicating pages or blocks
+RETRYABLE_WRITE_STATUSES = frozenset({429, 503})
+MAX_ATTEMPTS = 5
+MAX_RETRY_DELAY = 30.0
+
+
+@functools.cache
+def _shared_http_client(api_key: str) -> httpx.Client:
+    """Get the keep-alive httpx client shared by every NotionRecipeClient for an API key.
+
+    The Notion SDK sets auth headers on the client it is given, so pools are
+    shared per key rather than globally.
+
+    Args:
+        api_key: Notion API key
+
+    Returns:
+        httpx client, using HTTP/2 when h2 is installed
+    """
+    return httpx.Client(http2=HTTP2_AVAILABLE)
+
+
+def _with_retry(
+    request: Callable[..., Any], retry_statuses: frozenset[int] = RETRYABLE_STATUSES, **kwargs: Any
+) -> Any:
+    """Call a Notion API endpoint, retrying rate limits and transient errors.
+
+    Waits for the Retry-After header when Notion sends one, otherwise backs off
+    exponentially with jitter.
+
+    Args:
+        request: Notion SDK endpoint method, e.g. client.pages.create
+        retry_statuses: HTTP statuses to retry; writes should pass RETRYABLE_WRITE_STATUSES
+        **kwargs: Arguments for the endpoint
+
+    Returns:
+        Endpoint response
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return request(**kwargs)
+        except HTTPResponseError as e:
+            if e.status not in retry_statuses or attempt == MAX_ATTEMPTS - 1:
+                raise
+            try:
+                delay = float(e.headers.get("retry-after"))
+            except (TypeError, ValueError):
+                delay = 2 ** attempt + random.random()
+            time.sleep(min(delay, MAX_RETRY_DELAY))
+
+
+def _title(content: str) -> dict[str, Any]:
+    """Build a Notion title property.
+
+    Args:
+        content: Title text
+
+    Returns:
+        Notion title property value
+    """
+    return {"title": [{"text": {"content": content}}]}
+
+
+def _select(value: str) -> dict[str, Any]:
+    """Build a Notion select property.
+
+    Args:
+        value: Option name
+
+    Returns:
+        Notion select property value
+    """
+    return {"select": {"name": value.strip()}}
+
+
+def _multi_select(value: str) -> dict[str, Any]:
+    """Build a Notion multi-select property from a comma-separated value.
+
+    Args:
+        value: Comma-separated option names, e.g. "Thai, Indian"
+
+    Returns:
+        Notion multi-select property value
+    """
+    if "," not in value:
+        value = value.strip()
+        return {"multi_select": [{"name": value}] if value else []}
+    return {"multi_select": [{"name": val} for item in value.split(",") if (val := item.strip())]}
+
+
+def _rich_text(content: str, code: bool = False) -> list[dict[str, Any]]:
+    """Build a Notion rich text array holding a single text run.
+
+    Args:
+        content: Text content
+        code: Render the text with code (monospace) annotation
+
+    Returns:
+        Notion rich text array
+    """
+    run = {"type": "text", "text": {"content": content}}
+    if code:
+        run["annotations"] = {"code": True}
+    return [run]
+
+
+def _text_block(block_type: str, content: str) -> dict[str, Any]:
+    """Build a Notion text block (heading, paragraph, list item) with plain content.
+
+    Args:
+        block_type: Notion block type, e.g. "heading_2" or "paragraph"
+        content: Text content
+
+    Returns:
+        Notion block object
+    """
+    return {"object": "block", "type": block_type, block_type: {"rich_text": _rich_text(content)}}
+
+
+def _table_row(cells: list[str], code: bool = False) -> dict[str, Any]:
+    """Build a Notion table row from cell strings.
+
+    Args:
+        cells: Text content of each cell
+        code: Render the cells with code (monospace) annotation
+
+    Returns:
+        Notion table row object
+    """
+    return {"type": "table_row", "table_row": {"cells": [_rich_text(cell, code) for cell in cells]}}
+
+
+def _direction_block(direction_line: str) -> dict[str, Any] | None:
+    """Build the Notion block for one stripped line of the directions section.
+
+    Args:
+        direction_line: Directions line with surrounding whitespace removed
+
+    Returns:
+        A heading_3 block for ### subheadings, a numbered list item for steps, or
+        None for blank lines, horizontal rules and bare step numbers
+    """
+    # Skip blank lines and horizontal rules
+    if not direction_line or direction_line == "---":
+        return None
+
+    # Check if this is a subheading (### heading)
+    if direction_line.startswith("###"):
+        return _text_block("heading_3", direction_line.lstrip("#").strip())
+
+    # Remove markdown numbering ("1.") if present, and only add if there's content left
+    digits = len(direction_line) - len(direction_line.lstrip("0123456789"))
+    if digits and direction_line[digits:digits + 1] == ".":
+        direction_text = direction_line[digits + 1:].lstrip()
+    else:
+        direction_text = direction_line
+    if not direction_text.strip():
+        return None
+    return _text_block("numbered_list_item", direction_text)
+
+
+# Static blocks shared by every page; the SDK only serializes them, never mutates
+_DIVIDER = {"object": "block", "type": "divider", "divider": {}}
+_INGREDIENT_TABLE_HEADER = _table_row(["Ingredient", "Measurement", "Method"])
+
+
+def _ingredient_tables(table_rows: list[list[str]]) -> list[dict[str, Any]]:
+    """Build Notion table blocks for parsed ingredient rows.
+
+    Data rows use code formatting (monospace font). A table's rows count against
+    the same per-request children limit, so very long tables are split, repeating
+    the header row.
+
+    Args:
+        table_rows: [ingredient, measurement, method] cells for each row
+
+    Returns:
+        List of table blocks (empty if there are no rows)
+    """
+    rows_per_table = MAX_BLOCKS_PER_REQUEST - 1
+    return [
+        {
+            "object": "block",
+            "type": "table",
+            "table": {
+                "table_width": 3,
+                "has_column_header": True,
+                "has_row_header": False,
+                "children": [
+                    _INGREDIENT_TABLE_HEADER,
+                    *(_table_row(row, code=True) for row in table_rows[start:start + rows_per_table]),
+                ],
+            }
+        }
+        for start in range(0, len(table_rows), rows_per_table)
+    ]
+
+
+def _scan_markdown(markdown: str) -> tuple[str | None, dict[str, str]]:
+    """Extract the recipe title and ## sections from markdown in a single pass.
+
+    The title is the first "# " heading. A section runs until a --- rule or the
+    next ## heading (### subheadings stay in the section). Only the first
+    occurrence of each section is kept.
+
+    Args:
+        markdown: Recipe markdown string
+
+    Returns:
+        Tuple of (title or None, dictionary mapping each section name to its
+        stripped content, "" if missing)
+    """
+    name = None
+    buckets: dict[str, list[str]] = {}
+    current = None
+
+    # Without any heading there is neither a title nor a section to find
+    if "#" not in markdown:
+        return name, dict.fromkeys(_SECTIONS, "")
+
+    for line in markdown.splitlines():
+        # Only heading and rule lines can name the recipe or start/end a section
+        if line.startswith(("#", "-")):
+            if name is None and line[0] == "#" and line[1:2].isspace() and line[1:].strip():
+                name = line[1:].lstrip()
+            heading = _SECTION_HEADING_RE.match(line)
+            if heading and heading.group(1) not in buckets:
+                current = buckets[heading.group(1)] = []
+                continue
+            if _SECTION_END_RE.match(line):
+                current = None
+                continue
+        if current is not None:
+            current.append(line)
+
+    sections = {section: "\n".join(buckets.get(section, ())).strip() for section in _SECTIONS}
+    return name, sections
+
+
+def _parse_properties_line(markdown: str) -> dict[str, str]:
+    """Parse the pipe-delimited "*Cuisine: ... | ... | Cook Time: ...*" properties line.
+
+    Args:
+        markdown: Recipe markdown string
+
+    Returns:
+        Dictionary mapping each property label to its value, or an empty dict if
+        no complete properties line is found
+    """
+    start = markdown.find("*Cuisine:")
+    while start != -1:
+        end = markdown.find("\n", start)
+        fields = markdown[start + 1:end if end != -1 else None].split("|", len(_PROPERTY_LABELS) - 1)
+
+        properties = {}
+        for label, field in zip(_PROPERTY_LABELS, fields):
+            field = field.lstrip()
+            value = field[len(label) + 1:]
+            if not field.startswith(label + ":") or not value:
+                break
+            properties[label] = value
+        else:
+            # The cook time runs up to the closing asterisk
+            cook_time, star, _ = properties.get("Cook Time", "").partition("*")
+            if len(properties) == len(_PROPERTY_LABELS) and star and cook_time:
+                properties["Cook Time"] = cook_time
+                return {label: value.strip() for label, value in properties.items()}
+
+        start = markdown.find("*Cuisine:", start + 1)
+
+    return {}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_recipe_markdown(markdown: str) -> dict[str, Any]:
+    """Parse recipe markdown into structured data.
+
+    Results are cached by markdown content; callers must copy before mutating.
+
+    Args:
+        markdown: Recipe markdown string
+
+    Returns:
+        Dictionary with recipe components
+    """
+    # Extract recipe name (first line starting with #) and the ingredients, directions,
+    # photos, links, notes and nutrition sections in one pass over the lines
+    name, sections = _scan_markdown(markdown)
+    if name is None:
+        name = "Untitled Recipe"
+
+    # Extract properties line (cuisine, protein, course, method, effort, rating, cook time)
+    properties = _parse_properties_line(markdown)
+    cuisine = properties.get("Cuisine", "")
+    protein = properties.get("Protein", "")
+    course = properties.get("Course", "")
+    method = properties.get("Method", "")
+    effort = properties.get("Effort", "")
+    rating = properties.get("Rating", "")
+    cook_time_prop = properties.get("Cook Time", "")
+
+    # Extract metadata in one scan, keeping the first value of each field
+    metadata: dict[str, str] = {}
+    if "**" in markdown:
+        for field, value in _METADATA_RE.findall(markdown):
+            metadata.setdefault(field, value.strip())
+
+    return {
+        "name": name,
+        "cuisine": cuisine,
+        "protein": protein,
+        "course": course,
+        "method": method,
+        "effort": effort,
+        "rating": rating,
+        "cook_time_prop": cook_time_prop,
+        "prep_time": metadata.get("Prep Time", ""),
+        "cook_time": metadata.get("Cook Time", ""),
+        "total_time": metadata.get("Total Time", ""),
+        "servings": metadata.get("Servings", ""),
+        "ingredients": sections["Ingredients"],
+        "directions": sections["Directions"],
+        "notes": sections["Notes"],
+        "links": sections["Links"],
+        "nutrition": sections["Nutrition"],
+        "photos": sections["Photos"],
+    }
 
 
 class NotionRecipeClient:
     """Client for pushing recipe data to Notion databases."""
 
-    # Database property options (for reference - may be overridden by actual database schema)
-    CUISINE_OPTIONS = ["Moroccan", "Caribbean", "Vietnamese", "Turkish", "Lebanese", "Brazilian",
-                       "Korean", "Spanish", "Thai", "Indian", "Southern", "Greek", "Mexican",
-                       "French", "American", "Italian", "Chinese"]
+    # Database property options (for reference - may be overridden by actual database schema),
+    # as sets for O(1) membership checks
+    CUISINE_OPTIONS = frozenset({"Moroccan", "Caribbean", "Vietnamese", "Turkish", "Lebanese", "Brazilian",
+                                 "Korean", "Spanish", "Thai", "Indian", "Southern", "Greek", "Mexican",
+                                 "French", "American", "Italian", "Chinese"})
 
-    PROTEIN_OPTIONS = ["Fish", "Veg", "Beef", "Pork", "Turkey", "Chicken"]
+    PROTEIN_OPTIONS = frozenset({"Fish", "Veg", "Beef", "Pork", "Turkey", "Chicken"})
 
-    COURSE_OPTIONS = ["Dinner", "Lunch", "Breakfast", "Sauce", "Salad", "Main Course",
-                      "Soup", "Dessert", "Side", "Appetizer", "Beverage"]
+    COURSE_OPTIONS = frozenset({"Dinner", "Lunch", "Breakfast", "Sauce", "Salad", "Main Course",
+                                "Soup", "Dessert", "Side", "Appetizer", "Beverage"})
 
-    METHOD_OPTIONS = ["Smoking", "Baking", "Blanching", "Microwaving", "Sautéing",
-                      "Broiling", "No-Cook", "Marinating", "Pickling", "Braising",
-                      "Steaming", "Oven", "Fry", "Roast", "Stove Top", "Grill",
-                      "BBQ", "Crockpot"]
+    METHOD_OPTIONS = frozenset({"Smoking", "Baking", "Blanching", "Microwaving", "Sautéing",
+                                "Broiling", "No-Cook", "Marinating", "Pickling", "Braising",
+                                "Steaming", "Oven", "Fry", "Roast", "Stove Top", "Grill",
+                                "BBQ", "Crockpot"})
 
-    EFFORT_OPTIONS = ["🔪", "🔪🔪", "🔪🔪🔪"]
+    EFFORT_OPTIONS = frozenset({"🔪", "🔪🔪", "🔪🔪🔪"})
 
-    def __init__(self, api_key: Optional[str] = None, database_id: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        database_id: str | None = None,
+        http_client: httpx.Client | None = None,
+    ):
         """
         Initialize Notion client.
 
         Args:
             api_key: Notion API key. If None, reads from NOTION_API_KEY env var.
             database_id: Notion database ID. If None, reads from NOTION_DATABASE_ID env var.
+            http_client: Optional httpx client for connection pooling. The Notion SDK sets
+                auth headers on it, so it must not be shared between different API keys.
+                Defaults to a keep-alive client, shared by instances with the same API key,
+                using HTTP/2 when h2 is installed.
         """
         self.api_key = api_key or os.getenv("NOTION_API_KEY")
         self.database_id = database_id or os.getenv("NOTION_DATABASE_ID")
@@ -44,9 +438,18 @@ class NotionRecipeClient:
         if not self.database_id:
             raise ValueError("Notion database ID is required. Set NOTION_DATABASE_ID env var or pass database_id parameter.")
 
-        self.client = Client(auth=self.api_key)
+        if http_client is None:
+            http_client = _shared_http_client(self.api_key)
+
+        self.client = Client(auth=self.api_key, client=http_client, **_SDK_OPTIONS)
+
+        # Property names in the database, fetched on first push (None if unreadable)
+        self._property_names: frozenset[str] | None = None
+        self._schema_loaded = False
+        # Concurrent pushes wait for the first fetch instead of skipping the filter
+        self._schema_lock = threading.Lock()
 
-    def parse_recipe_markdown(self, markdown: str) -> dict:
+    def parse_recipe_markdown(self, markdown: str) -> dict[str, Any]:
         """
         Parse recipe markdown into structured data.
 
@@ -56,86 +459,9 @@ class NotionRecipeClient:
         Returns:
             Dictionary with recipe components
         """
-        # Extract recipe name (first line starting with #)
-        name_match = re.search(r'^#\s+(.+)$', markdown, re.MULTILINE)
-        name = name_match.group(1) if name_match else "Untitled Recipe"
-
-        # Extract properties line (cuisine, protein, course, method, effort, rating, cook time)
-        # Updated pattern to match new property names
-        properties_match = re.search(r'\*Cuisine:\s*([^|]+)\s*\|\s*Protein:\s*([^|]+)\s*\|\s*Course:\s*([^|]+)\s*\|\s*Method:\s*([^|]+)\s*\|\s*Effort:\s*([^|]+)\s*\|\s*Rating:\s*([^|]+)\s*\|\s*Cook Time:\s*([^*]+)\*', markdown)
-        cuisine = properties_match.group(1).strip() if properties_match else ""
-        protein = properties_match.group(2).strip() if properties_match else ""
-        course = properties_match.group(3).strip() if properties_match else ""
-        method = properties_match.group(4).strip() if properties_match else ""
-        effort = properties_match.group(5).strip() if properties_match else ""
-        rating = properties_match.group(6).strip() if properties_match else ""
-        cook_time_prop = properties_match.group(7).strip() if properties_match else ""
-
-        # Extract metadata
-        prep_time_match = re.search(r'\*\*Prep Time:\*\*\s*([^\n*]+)', markdown)
-        cook_time_match = re.search(r'\*\*Cook Time:\*\*\s*([^\n*]+)', markdown)
-        total_time_match = re.search(r'\*\*Total Time:\*\*\s*([^\n*]+)', markdown)
-        servings_match = re.search(r'\*\*Servings:\*\*\s*([^\n*]+)', markdown)
-
-        # Extract ingredients section
-        # Match until --- or next ## heading (but not ### subheadings)
-        # Use lookahead for ^--- and ^## to not consume them
-        ingredients_match = re.search(r'##\s+Ingredients\s*\n(.*?)(?=^---|^##\s[A-Z])', markdown, re.DOTALL | re.MULTILINE)
-        if not ingredients_match:
-            # Try without lookahead if at end of string
-            ingredients_match = re.search(r'##\s+Ingredients\s*\n(.*)', markdown, re.DOTALL | re.MULTILINE)
-        ingredients = ingredients_match.group(1).strip() if ingredients_match else ""
-
-        # Extract directions section
-        directions_match = re.search(r'##\s+Directions\s*\n(.*?)(?=^---|^##\s[A-Z])', markdown, re.DOTALL | re.MULTILINE)
-        if not directions_match:
-            directions_match = re.search(r'##\s+Directions\s*\n(.*)', markdown, re.DOTALL | re.MULTILINE)
-        directions = directions_match.group(1).strip() if directions_match else ""
-
-        # Extract photos section
-        photos_match = re.search(r'##\s+Photos\s*\n(.*?)(?=^---|^##\s[A-Z])', markdown, re.DOTALL | re.MULTILINE)
-        if not photos_match:
-            photos_match = re.search(r'##\s+Photos\s*\n(.*)', markdown, re.DOTALL | re.MULTILINE)
-        photos = photos_match.group(1).strip() if photos_match else ""
-
-        # Extract links section
-        links_match = re.search(r'##\s+Links\s*\n(.*?)(?=^---|^##\s[A-Z])', markdown, re.DOTALL | re.MULTILINE)
-        if not links_match:
-            links_match = re.search(r'##\s+Links\s*\n(.*)', markdown, re.DOTALL | re.MULTILINE)
-        links = links_match.group(1).strip() if links_match else ""
-
-        # Extract notes section
-        notes_match = re.search(r'##\s+Notes\s*\n(.*?)(?=^---|^##\s[A-Z])', markdown, re.DOTALL | re.MULTILINE)
-        if not notes_match:
-            notes_match = re.search(r'##\s+Notes\s*\n(.*)', markdown, re.DOTALL | re.MULTILINE)
-        notes = notes_match.group(1).strip() if notes_match else ""
-
-        # Extract nutrition section
-        nutrition_match = re.search(r'##\s+Nutrition\s*\n(.*?)(?=^---|^##\s[A-Z])', markdown, re.DOTALL | re.MULTILINE)
-        if not nutrition_match:
-            nutrition_match = re.search(r'##\s+Nutrition\s*\n(.*)', markdown, re.DOTALL | re.MULTILINE)
-        nutrition = nutrition_match.group(1).strip() if nutrition_match else ""
-
-        return {
-            "name": name,
-            "cuisine": cuisine,
-            "protein": protein,
-            "course": course,
-            "method": method,
-            "effort": effort,
-            "rating": rating,
-            "cook_time_prop": cook_time_prop,
-            "prep_time": prep_time_match.group(1).strip() if prep_time_match else "",
-            "cook_time": cook_time_match.group(1).strip() if cook_time_match else "",
-            "total_time": total_time_match.group(1).strip() if total_time_match else "",
-            "servings": servings_match.group(1).strip() if servings_match else "",
-            "ingredients": ingredients,
-            "directions": directions,
-            "notes": notes,
-            "links": links,
-            "nutrition": nutrition,
-            "photos": photos,
-        }
+        # Parsing is pure, so repeated pushes of the same markdown hit the cache;
+        # copy the result so callers can't mutate the cached entry
+        return dict(_parse_recipe_markdown(markdown))
 
     def push_recipe(self, markdown: str, verbose: bool = False) -> str:
         """
@@ -151,99 +477,60 @@ class NotionRecipeClient:
         recipe_data = self.parse_recipe_markdown(markdown)
 
         if verbose:
-            import sys
-            print(f"Recipe name: {recipe_data['name']}", file=sys.stderr)
-            print(f"Cuisine: {recipe_data.get('cuisine', 'N/A')}", file=sys.stderr)
-            print(f"Protein: {recipe_data.get('protein', 'N/A')}", file=sys.stderr)
-            print(f"Course: {recipe_data.get('course', 'N/A')}", file=sys.stderr)
-            print(f"Method: {recipe_data.get('method', 'N/A')}", file=sys.stderr)
-            print(f"Effort: {recipe_data.get('effort', 'N/A')}", file=sys.stderr)
-            print(f"Rating: {recipe_data.get('rating', 'N/A')}", file=sys.stderr)
-            print(f"Cook Time: {recipe_data.get('cook_time_prop') or recipe_data.get('cook_time', 'N/A')}", file=sys.stderr)
-            print(f"Ingredients: {len(recipe_data['ingredients'].split(chr(10)))} lines", file=sys.stderr)
-            print(f"Directions: {len(recipe_data['directions'].split(chr(10)))} lines", file=sys.stderr)
-
-        # Build properties - only Name is required, rest are optional multi-select
-        properties = {
-            "Name": {
-                "title": [
-                    {
-                        "text": {
-                            "content": recipe_data["name"]
-                        }
-                    }
-                ]
-            }
-        }
+            ingredient_lines = recipe_data["ingredients"].count("\n") + 1
+            direction_lines = recipe_data["directions"].count("\n") + 1
+            print(
+                f"Recipe name: {recipe_data['name']}\n"
+                f"Cuisine: {recipe_data.get('cuisine', 'N/A')}\n"
+                f"Protein: {recipe_data.get('protein', 'N/A')}\n"
+                f"Course: {recipe_data.get('course', 'N/A')}\n"
+                f"Method: {recipe_data.get('method', 'N/A')}\n"
+                f"Effort: {recipe_data.get('effort', 'N/A')}\n"
+                f"Rating: {recipe_data.get('rating', 'N/A')}\n"
+                f"Cook Time: {recipe_data.get('cook_time_prop') or recipe_data.get('cook_time', 'N/A')}\n"
+                f"Ingredients: {ingredient_lines} lines\n"
+                f"Directions: {direction_lines} lines",
+                file=sys.stderr,
+            )
 
-        # Add Cuisine property if present
-        if recipe_data.get("cuisine"):
-            # Split by comma if multiple values
-            cuisine_values = [c.strip() for c in recipe_data["cuisine"].split(",")]
-            properties["Cuisine"] = {
-                "multi_select": [{"name": val} for val in cuisine_values if val]
-            }
+        # Build properties - only Name is required, rest are optional
+        properties = {"Name": _title(recipe_data["name"])}
 
-        # Add Protein property if present
-        if recipe_data.get("protein"):
-            protein_values = [p.strip() for p in recipe_data["protein"].split(",")]
-            properties["Protein"] = {
-                "multi_select": [{"name": val} for val in protein_values if val]
-            }
+        # Add multi-select properties if present (Method was renamed from Cooking Method)
+        for prop_name, key in _MULTI_SELECT_PROPERTIES:
+            if recipe_data.get(key):
+                properties[prop_name] = _multi_select(recipe_data[key])
 
-        # Add Course property if present
-        if recipe_data.get("course"):
-            course_values = [c.strip() for c in recipe_data["course"].split(",")]
-            properties["Course"] = {
-                "multi_select": [{"name": val} for val in course_values if val]
-            }
+        # Add Effort (knife emojis) and Rating select properties if present
+        for prop_name, key in (("Effort", "effort"), ("Rating", "rating")):
+            if recipe_data.get(key):
+                properties[prop_name] = _select(recipe_data[key])
 
-        # Add Method property if present (renamed from Cooking Method)
-        if recipe_data.get("method"):
-            method_values = [m.strip() for m in recipe_data["method"].split(",")]
-            properties["Method"] = {
-                "multi_select": [{"name": val} for val in method_values if val]
-            }
-
-        # Add Effort property if present (select type with knife emojis)
-        if recipe_data.get("effort"):
-            properties["Effort"] = {
-                "select": {"name": recipe_data["effort"].strip()}
-            }
-
-        # Add Rating property if present (select type)
-        if recipe_data.get("rating"):
-            properties["Rating"] = {
-                "select": {"name": recipe_data["rating"].strip()}
-            }
+        # Drop properties the database doesn't have, so the create succeeds first time
+        property_names = self._get_property_names()
+        if property_names is not None:
+            missing = [k for k in properties if k != "Name" and k not in property_names]
+            if missing:
+                if verbose:
+                    print(f"⚠️  Properties not found in database, skipping: {', '.join(missing)}", file=sys.stderr)
+                properties = {k: v for k, v in properties.items() if k not in missing}
 
         # Create page in Notion database
-        if verbose:
-            import sys
-            print(f"Building Notion page blocks...", file=sys.stderr)
-
         blocks = self._build_page_content(recipe_data)
 
         if verbose:
-            import sys
-            print(f"Created {len(blocks)} Notion blocks", file=sys.stderr)
-            print(f"Creating Notion page...", file=sys.stderr)
+            print(f"Created {len(blocks)} Notion blocks\nCreating Notion page...", file=sys.stderr)
 
         # Try to create the page with all properties
         try:
-            new_page = self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties,
-                children=blocks
-            )
-            return new_page["url"]
+            return self._create_page(properties, blocks, verbose=verbose)
         except Exception as e:
-            # If a property doesn't exist, retry with only Name property
-            import sys
-            error_msg = str(e)
-            if "is not a property that exists" in error_msg:
+            # If a property doesn't exist (schema unreadable or changed since it was
+            # fetched), retry with only Name property
+            missing_property = _MISSING_PROPERTY_RE.search(str(e))
+            if missing_property:
                 # Extract which property failed
-                failed_prop = error_msg.split("is not a property")[0].strip()
+                failed_prop = missing_property.group(1).strip()
                 if verbose:
                     print(f"⚠️  Property '{failed_prop}' not found in database, retrying without optional properties...", file=sys.stderr)
 
@@ -252,28 +539,131 @@ class NotionRecipeClient:
                     "Name": properties["Name"]
                 }
 
-                new_page = self.client.pages.create(
-                    parent={"database_id": self.database_id},
-                    properties=minimal_properties,
-                    children=blocks
-                )
+                page_url = self._create_page(minimal_properties, blocks, verbose=verbose)
 
                 if verbose:
-                    print(f"⚠️  Page created without properties: {', '.join([k for k in properties.keys() if k != 'Name'])}", file=sys.stderr)
-                    print(f"💡 To use properties, add these fields to your Notion database:", file=sys.stderr)
-                    print(f"   - Cuisine (multi-select)", file=sys.stderr)
-                    print(f"   - Protein (multi-select)", file=sys.stderr)
-                    print(f"   - Course (multi-select)", file=sys.stderr)
-                    print(f"   - Method (multi-select)", file=sys.stderr)
-                    print(f"   - Effort (select)", file=sys.stderr)
-                    print(f"   - Rating (select)", file=sys.stderr)
-
-                return new_page["url"]
+                    print(
+                        f"⚠️  Page created without properties: {', '.join(k for k in properties if k != 'Name')}\n"
+                        + _PROPERTY_SETUP_HINT,
+                        file=sys.stderr,
+                    )
+
+                return page_url
             else:
                 # Re-raise if it's a different error
                 raise
 
-    def _build_page_content(self, recipe_data: dict) -> list:
+    def push_recipes(self, markdowns: list[str], concurrency: int = 3, verbose: bool = False) -> list[str]:
+        """
+        Push several recipes to the Notion database concurrently.
+
+        Notion rate limits integrations to about three requests per second, so
+        the default pool is small; 429s are still retried by each request.
+
+        Args:
+            markdowns: Recipe markdown strings
+            concurrency: Maximum number of pages created at once
+            verbose: Enable verbose logging
+
+        Returns:
+            URLs of the created Notion pages, in input order
+        """
+        if len(markdowns) <= 1:
+            return [self.push_recipe(markdown, verbose=verbose) for markdown in markdowns]
+
+        # Load the schema up front so the workers don't all fetch it
+        self._get_property_names()
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(markdowns))) as executor:
+            return list(executor.map(lambda markdown: self.push_recipe(markdown, verbose=verbose), markdowns))
+
+    def _get_property_names(self) -> frozenset[str] | None:
+        """
+        Get the property names defined in the database, fetching the schema once.
+
+        Returns:
+            Set of property names, or None if the schema couldn't be read
+        """
+        if self._schema_loaded:
+            return self._property_names
+
+        with self._schema_lock:
+            if not self._schema_loaded:
+                try:
+                    schema = self._retrieve_schema()
+                except (NotionClientErrorBase, httpx.HTTPError, LookupError, TypeError):
+                    # Filtering is only an optimisation; push_recipe still retries the
+                    # create without properties if one turns out to be missing.
+                    # API errors, timeouts, transport failures and unexpected shapes all land here
+                    schema = None
+                self._property_names = frozenset(schema) if schema else None
+                # Set last, so the unlocked check above never sees a half-loaded schema
+                self._schema_loaded = True
+
+        return self._property_names
+
+    def _retrieve_schema(self) -> dict[str, Any] | None:
+        """
+        Fetch the database's property schema.
+
+        Notion API versions from 2025-09-03 on (the notion-client 3.x default) move
+        properties from the database to its data sources, so the schema is read from
+        the single data source a database_id parent writes to.
+
+        Returns:
+            Property schema keyed by name, or None if it can't be determined
+        """
+        database = _with_retry(self.client.databases.retrieve, database_id=self.database_id)
+        schema: dict[str, Any] | None
+        if "properties" in database:
+            schema = database["properties"]
+            return schema
+
+        data_sources = database.get("data_sources") or []
+        if len(data_sources) != 1:
+            return None
+
+        data_source = _with_retry(self.client.data_sources.retrieve, data_source_id=data_sources[0]["id"])
+        schema = data_source.get("properties")
+        return schema
+
+    def _create_page(
+        self, properties: dict[str, Any], blocks: list[dict[str, Any]], verbose: bool = False
+    ) -> str:
+        """
+        Create the recipe page, appending blocks beyond the per-request limit afterwards.
+
+        Args:
+            properties: Notion page properties
+            blocks: Page content blocks
+            verbose: Enable verbose logging
+
+        Returns:
+            URL of the created Notion page
+        """
+        new_page = _with_retry(
+            self.client.pages.create,
+            retry_statuses=RETRYABLE_WRITE_STATUSES,
+            parent={"database_id": self.database_id},
+            properties=properties,
+            children=blocks[:MAX_BLOCKS_PER_REQUEST]
+        )
+
+        # Appends land at the end of the page, so remaining chunks must go in order
+        for start in range(MAX_BLOCKS_PER_REQUEST, len(blocks), MAX_BLOCKS_PER_REQUEST):
+            if verbose:
+                print(f"Appending Notion blocks {start + 1}-{min(start + MAX_BLOCKS_PER_REQUEST, len(blocks))}...", file=sys.stderr)
+            _with_retry(
+                self.client.blocks.children.append,
+                retry_statuses=RETRYABLE_WRITE_STATUSES,
+                block_id=new_page["id"],
+                children=blocks[start:start + MAX_BLOCKS_PER_REQUEST]
+            )
+
+        url: str = new_page["url"]
+        return url
+
+    def _build_page_content(self, recipe_data: dict[str, Any]) -> list[dict[str, Any]]:
         """
         Build Notion page content blocks from recipe data.
 
@@ -295,249 +685,65 @@ class NotionRecipeClient:
 
         # 1. Add ingredients section with tables
         if recipe_data["ingredients"]:
-            blocks.append({
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [{"type": "text", "text": {"content": "Ingredients"}}]
-                }
-            })
+            blocks.append(_text_block("heading_2", "Ingredients"))
 
             # Parse ingredients - can have multiple tables separated by subheadings
-            ingredient_content = recipe_data["ingredients"]
-            ingredient_lines = ingredient_content.split("\n")
+            table_rows: list[list[str]] | None = None
+            expect_separator = False
+            for line in recipe_data["ingredients"].splitlines():
+                line = line.strip()
+
+                if table_rows is not None:
+                    # Skip separator row (|---|---|---|) right after the header
+                    if expect_separator:
+                        expect_separator = False
+                        if "---" in line:
+                            continue
+
+                    # Parse the table row: | ingredient | measurement | method |
+                    if line.startswith("|"):
+                        parts = [p.strip() for p in line.split("|")[1:-1]]  # Remove first and last empty elements
+                        if len(parts) >= 3:
+                            table_rows.append(parts[:3])
+                        continue
 
-            i = 0
-            while i < len(ingredient_lines):
-                line = ingredient_lines[i].strip()
+                    # Any other line ends the table and is handled below
+                    blocks.extend(_ingredient_tables(table_rows))
+                    table_rows = None
 
                 # Check for subheading (### heading)
                 if line.startswith("###"):
-                    subheading_text = line.lstrip("#").strip()
-                    blocks.append({
-                        "object": "block",
-                        "type": "heading_3",
-                        "heading_3": {
-                            "rich_text": [{"type": "text", "text": {"content": subheading_text}}]
-                        }
-                    })
-                    i += 1
-                    continue
-
-                # Check for table header (starts with |)
-                if line.startswith("|") and "Ingredient" in line:
-                    # Found a table - collect all table rows
-                    table_rows = []
-                    i += 1  # Skip header row
+                    blocks.append(_text_block("heading_3", line.lstrip("#").strip()))
 
-                    # Skip separator row (|---|---|---|)
-                    if i < len(ingredient_lines) and "---" in ingredient_lines[i]:
-                        i += 1
+                # Check for table header (starts with |) - collect the rows that follow
+                elif line.startswith("|") and "Ingredient" in line:
+                    table_rows = []
+                    expect_separator = True
 
-                    # Collect data rows
-                    while i < len(ingredient_lines):
-                        row_line = ingredient_lines[i].strip()
-                        if not row_line or not row_line.startswith("|"):
-                            break
+            if table_rows is not None:
+                blocks.extend(_ingredient_tables(table_rows))
 
-                        # Parse the table row: | ingredient | measurement | method |
-                        parts = [p.strip() for p in row_line.split("|")[1:-1]]  # Remove first and last empty elements
-                        if len(parts) >= 3:
-                            table_rows.append({
-                                "ingredient": parts[0],
-                                "measurement": parts[1],
-                                "method": parts[2]
-                            })
-                        i += 1
-
-                    # Create Notion table block
-                    if table_rows:
-                        # Notion tables need width, height, and cells
-                        table_width = 3  # 3 columns
-                        table_height = len(table_rows) + 1  # +1 for header row
-
-                        # Build table block with code formatting (monospace font)
-                        blocks.append({
-                            "object": "block",
-                            "type": "table",
-                            "table": {
-                                "table_width": table_width,
-                                "has_column_header": True,
-                                "has_row_header": False,
-                                "children": [
-                                    # Header row
-                                    {
-                                        "type": "table_row",
-                                        "table_row": {
-                                            "cells": [
-                                                [{"type": "text", "text": {"content": "Ingredient"}}],
-                                                [{"type": "text", "text": {"content": "Measurement"}}],
-                                                [{"type": "text", "text": {"content": "Method"}}]
-                                            ]
-                                        }
-                                    }
-                                ] + [
-                                    # Data rows with code annotations for monospace font
-                                    {
-                                        "type": "table_row",
-                                        "table_row": {
-                                            "cells": [
-                                                [{"type": "text", "text": {"content": row["ingredient"]}, "annotations": {"code": True}}],
-                                                [{"type": "text", "text": {"content": row["measurement"]}, "annotations": {"code": True}}],
-                                                [{"type": "text", "text": {"content": row["method"]}, "annotations": {"code": True}}]
-                                            ]
-                                        }
-                                    } for row in table_rows
-                                ]
-                            }
-                        })
-                    continue
-
-                i += 1
-
-            # Add divider
-            blocks.append({
-                "object": "block",
-                "type": "divider",
-                "divider": {}
-            })
+            blocks.append(_DIVIDER)
 
         # 2. Add directions section with numbered list
         if recipe_data["directions"]:
-            blocks.append({
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [{"type": "text", "text": {"content": "Directions"}}]
-                }
-            })
+            blocks.append(_text_block("heading_2", "Directions"))
 
             # Parse directions into numbered list items, handling subheadings
-            direction_lines = [line.strip() for line in recipe_data["directions"].split("\n") if line.strip()]
-            for direction_line in direction_lines:
-                # Skip horizontal rules
-                if direction_line == "---":
-                    continue
-
-                # Check if this is a subheading (### heading)
-                if direction_line.startswith("###"):
-                    subheading_text = direction_line.lstrip("#").strip()
-                    blocks.append({
-                        "object": "block",
-                        "type": "heading_3",
-                        "heading_3": {
-                            "rich_text": [{"type": "text", "text": {"content": subheading_text}}]
-                        }
-                    })
-                    continue
-
-                # Remove markdown numbering if present
-                direction_text = re.sub(r'^\d+\.\s*', '', direction_line)
-                # Only add if there's actual content after removing numbering
-                if direction_text.strip():
-                    blocks.append({
-                        "object": "block",
-                        "type": "numbered_list_item",
-                        "numbered_list_item": {
-                            "rich_text": [{"type": "text", "text": {"content": direction_text}}]
-                        }
-                    })
-
-            # Add divider
-            blocks.append({
-                "object": "block",
-                "type": "divider",
-                "divider": {}
-            })
-
-        # 3. Add notes section (always show header)
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "Notes"}}]
-            }
-        })
-        if recipe_data["notes"]:
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": recipe_data["notes"]}}]
-                }
-            })
-
-        # Add divider
-        blocks.append({
-            "object": "block",
-            "type": "divider",
-            "divider": {}
-        })
-
-        # 4. Add links section (always show header)
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "Links"}}]
-            }
-        })
-        if recipe_data["links"]:
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": recipe_data["links"]}}]
-                }
-            })
-
-        # Add divider
-        blocks.append({
-            "object": "block",
-            "type": "divider",
-            "divider": {}
-        })
-
-        # 5. Add nutrition section (always show header)
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "Nutrition"}}]
-            }
-        })
-        if recipe_data.get("nutrition"):
-            # Nutrition can be multi-line, add as paragraph
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": recipe_data["nutrition"]}}]
-                }
-            })
+            blocks.extend(
+                block for line in recipe_data["directions"].split("\n")
+                if (block := _direction_block(line.strip())) is not None
+            )
 
-        # Add divider
-        blocks.append({
-            "object": "block",
-            "type": "divider",
-            "divider": {}
-        })
+            blocks.append(_DIVIDER)
 
-        # 6. Add photos section (always show header)
-        blocks.append({
-            "object": "block",
-            "type": "heading_2",
-            "heading_2": {
-                "rich_text": [{"type": "text", "text": {"content": "Photos"}}]
-            }
-        })
-        if recipe_data["photos"]:
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": recipe_data["photos"]}}]
-                }
-            })
+        # 3-6. Add notes, links, nutrition and photos sections (always show header)
+        for section in ("Notes", "Links", "Nutrition", "Photos"):
+            blocks.append(_text_block("heading_2", section))
+            content = recipe_data.get(section.lower())
+            if content:
+                blocks.append(_text_block("paragraph", content))
+            if section != "Photos":
+                blocks.append(_DIVIDER)
 
         return blocks
@@ -1,23 +1,207 @@
 """Core recipe processing logic."""
 
+import asyncio
 import base64
-from pathlib import Path
-from typing import Any, Optional
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path, PurePosixPath
+from typing import Any, cast
+from urllib.parse import urlsplit
+
+from anthropic import Anthropic, APIError, DefaultHttpxClient
+from anthropic.types import ImageBlockParam, TextBlock, TextBlockParam
+from anthropic.types.messages.batch_create_params import Request
 
-from anthropic import Anthropic
-from PIL import Image
-
-# Register HEIF support for iPhone images
-try:
-    from pillow_heif import register_heif_opener
-    register_heif_opener()
-except ImportError:
-    pass  # HEIF support not available
-
-from recipe_duck.formatter import RecipeFormatter
 from recipe_duck.config import FormattingConfig, PrintURLConfig
+from recipe_duck.formatter import RecipeFormatter
 from recipe_duck.url_extractor import URLRecipeExtractor, YouTubeRecipeExtractor
 
+logger = logging.getLogger(__name__)
+
+# Media types for supported image file extensions
+IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+# Downscale large images before upload; Claude vision works well at ~1568px longest
+# edge and ~1.15 megapixels, and resizes anything larger server-side anyway
+RESIZE_MAX_DIMENSION = 1568
+RESIZE_MAX_PIXELS = 1_150_000
+RESIZE_MIN_BYTES = 512 * 1024
+RESIZE_JPEG_QUALITY = 85
+
+# Files above this size are base64-encoded in chunks straight from disk when not
+# resized; the chunk size is a multiple of 3 so encoded chunks concatenate cleanly
+STREAM_ENCODE_MIN_BYTES = 2 * 1024 * 1024
+STREAM_ENCODE_CHUNK_BYTES = 48 * 1024
+
+# Token budget for extracted webpage/description text sent to the model. Text is
+# first cut to CHARS_PER_TOKEN_FALLBACK chars per budget token (also the final cut
+# when counting fails); text short enough to fit even at CHARS_PER_TOKEN_MIN is
+# sent without counting
+MAX_INPUT_TOKENS = 5000
+CHARS_PER_TOKEN_MIN = 2
+CHARS_PER_TOKEN_FALLBACK = 4
+TOKEN_TRIM_MAX_ROUNDS = 3
+
+# Seconds between status checks while a Message Batch is processing
+BATCH_POLL_INTERVAL = 30.0
+# Images encoded and submitted per Message Batch; each batch's base64 payload is
+# held in memory until it is sent, so this bounds peak memory for large backlogs
+BATCH_MAX_IMAGES = 50
+
+# Prompt sections shared by the image, webpage and YouTube extraction prompts
+_PROPERTY_OPTIONS_GUIDE = """  * Cuisine: Choose from (Moroccan, Caribbean, Vietnamese, Turkish, Lebanese, Brazilian, Korean, Spanish, Thai, Indian, Southern, Greek, Mexican, French, American, Italian, Chinese)
+  * Protein: Choose from (Fish, Veg, Beef, Pork, Turkey, Chicken) - can be multiple separated by commas
+  * Course: Choose from (Dinner, Lunch, Breakfast, Sauce, Salad, Main Course, Soup, Dessert, Side, Appetizer, Beverage)
+  * Method: Choose from (Smoking, Baking, Blanching, Microwaving, Sautéing, Broiling, No-Cook, Marinating, Pickling, Braising, Steaming, Oven, Fry, Roast, Stove Top, Grill, BBQ, Crockpot) - can be multiple separated by commas
+  * Effort: Estimate effort level - use 🔪 for quick/easy recipes (under 1 hour), 🔪🔪 for medium effort (over 1 hour), 🔪🔪🔪 for high effort (multi-day, overnight, or long marinating)"""
+
+_FORMATTING_GUIDELINES = """IMPORTANT FORMATTING GUIDELINES:
+- Write out abbreviated units (e.g., "2 tbsp" → "2 tablespoon", "1 tsp" → "1 teaspoon")
+- Use ASCII fractions instead of unicode (e.g., "½" → "1/2", "¼" → "1/4")
+- Use explicit numbered steps for directions (1., 2., 3., etc.) with blank lines between steps
+- Pluralize units when quantity is greater than 1 (e.g., "2 tablespoons", "3 cups")
+- Always include horizontal rules (---) between sections"""
+
+
+def _cached_system_prompt(text: str) -> list[TextBlockParam]:
+    """Wrap static prompt text as a system block marked for Anthropic prompt caching.
+
+    The API only caches prefixes above a model-specific minimum length; shorter
+    prompts are processed normally at no extra cost.
+
+    Args:
+        text: Prompt text that is identical across requests
+
+    Returns:
+        System content blocks for messages.create
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+def default_cache_dir() -> Path:
+    """Get the default directory for cached model responses.
+
+    Returns:
+        $XDG_CACHE_HOME/recipe_duck, falling back to ~/.cache/recipe_duck
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "recipe_duck"
+
+
+def is_image_url(url: str) -> bool:
+    """Check whether a URL points directly at an image file the API can fetch.
+
+    Args:
+        url: HTTP(S) URL
+
+    Returns:
+        True if the URL path ends with a supported image extension
+    """
+    return PurePosixPath(urlsplit(url).path).suffix.lower() in IMAGE_MEDIA_TYPES
+
+
+@functools.cache
+def _load_pillow() -> Any:
+    """Import Pillow on first use, so small images never pay for loading it.
+
+    Returns:
+        The PIL.Image module, with HEIF support registered when available
+    """
+    from PIL import Image
+
+    # Register HEIF support for iPhone images
+    try:
+        from pillow_heif import register_heif_opener
+        register_heif_opener()
+    except ImportError:
+        pass  # HEIF support not available
+
+    return Image
+
+
+def downscale_image(image_bytes: bytes, suffix: str) -> tuple[bytes, str]:
+    """Downscale and re-encode an image to shrink the API payload.
+
+    Small JPEG/PNG images are returned unchanged. HEIC/HEIF images are always
+    re-encoded since they cannot be sent to the API as-is. Images are re-encoded
+    as JPEG, except transparent ones which stay PNG so the alpha channel isn't
+    flattened onto black.
+
+    Args:
+        image_bytes: Raw image file contents
+        suffix: Original file extension (e.g., ".heic")
+
+    Returns:
+        Tuple of (image_bytes, suffix) for the image to send
+    """
+    suffix = suffix.lower()
+    if len(image_bytes) < RESIZE_MIN_BYTES and suffix not in (".heic", ".heif"):
+        return image_bytes, suffix
+
+    Image = _load_pillow()
+    with Image.open(BytesIO(image_bytes)) as img:
+        # Fit within both the longest-edge and the total-pixel budget
+        width, height = img.size
+        scale = min(1.0, RESIZE_MAX_DIMENSION / max(width, height), (RESIZE_MAX_PIXELS / (width * height)) ** 0.5)
+        img.thumbnail((max(1, int(width * scale)), max(1, int(height * scale))), Image.LANCZOS)
+
+        buffer = BytesIO()
+        if img.mode in ("RGBA", "LA") or "transparency" in img.info:
+            img.save(buffer, "PNG", optimize=True)
+            return buffer.getvalue(), ".png"
+
+        img.convert("RGB").save(buffer, "JPEG", quality=RESIZE_JPEG_QUALITY, optimize=True)
+
+    return buffer.getvalue(), ".jpg"
+
+
+def encode_file_base64(path: Path) -> str:
+    """Base64-encode a file in fixed-size chunks without reading it whole.
+
+    Args:
+        path: File to encode
+
+    Returns:
+        Base64-encoded file contents
+    """
+    encoded = bytearray()
+    with path.open("rb") as f:
+        while chunk := f.read(STREAM_ENCODE_CHUNK_BYTES):
+            encoded += base64.b64encode(chunk)
+
+    return encoded.decode("ascii")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template_cached(path: str) -> str:
+    """Read a template file, memoized so batch runs only hit disk once.
+
+    Args:
+        path: Resolved template path as a string
+
+    Returns:
+        Template content as string
+    """
+    template_path = Path(path)
+    if not template_path.exists():
+        raise FileNotFoundError(f"Template not found: {template_path}")
+
+    return template_path.read_text()
+
 
 class RecipeProcessor:
     """Processes recipe images and converts them to markdown."""
@@ -27,18 +211,32 @@ class RecipeProcessor:
         api_key: str,
         model: str = "claude-haiku-4-5",
         template_path: Path | None = None,
-        formatting_config: Optional[FormattingConfig] = None,
+        formatting_config: FormattingConfig | None = None,
         apply_formatting: bool = True,
-        print_url_config: Optional[PrintURLConfig] = None,
-        youtube_api_key: Optional[str] = None,
+        print_url_config: PrintURLConfig | None = None,
+        youtube_api_key: str | None = None,
+        http_client: DefaultHttpxClient | None = None,
+        resize_images: bool = True,
+        cache_dir: Path | None = None,
+        max_input_tokens: int = MAX_INPUT_TOKENS,
     ):
-        self.client = Anthropic(api_key=api_key)
+        # A shared http_client lets callers reuse pooled keep-alive connections
+        self.client = Anthropic(api_key=api_key, http_client=http_client)
         self.model = model
         self.template = self._load_template(template_path)
+        self._image_prompt = self._build_image_prompt()
+        self._url_system_prompt = self._build_url_system_prompt()
+        self._youtube_system_prompt = self._build_youtube_system_prompt()
         self.apply_formatting = apply_formatting
+        self.resize_images = resize_images
+        # Raw model responses are cached here by request content when set
+        self.cache_dir = cache_dir
+        self.max_input_tokens = max_input_tokens
         self.formatter = RecipeFormatter(formatting_config) if apply_formatting else None
         self.print_url_config = print_url_config or PrintURLConfig()
-        self.url_extractor = URLRecipeExtractor(anthropic_client=self.client)
+        self.url_extractor = URLRecipeExtractor(
+            anthropic_client=self.client, cache_dir=cache_dir / "pages" if cache_dir else None
+        )
         self.youtube_extractor = YouTubeRecipeExtractor(api_key=youtube_api_key)
 
     def _load_template(self, template_path: Path | None) -> str:
@@ -54,10 +252,80 @@ class RecipeProcessor:
             # Default to recipe_template.md in templates directory
             template_path = Path(__file__).parent / "templates" / "recipe_template.md"
 
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
+        return _load_template_cached(str(Path(template_path).resolve()))
 
-        return template_path.read_text()
+    def _response_cache_path(self, system: str, content: Any) -> Path | None:
+        """Get the cache file for a model request, keyed by everything sent to the model.
+
+        Args:
+            system: System prompt text (includes the template)
+            content: User message content
+
+        Returns:
+            Path of the cache entry, or None if caching is disabled
+        """
+        if self.cache_dir is None:
+            return None
+
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (self.model, system, json.dumps(content, sort_keys=True)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return self.cache_dir / f"{digest.hexdigest()}.md"
+
+    def _read_cached_response(self, cache_path: Path | None, verbose: bool = False) -> str | None:
+        """Read a cached raw model response.
+
+        Args:
+            cache_path: Cache entry from _response_cache_path
+            verbose: Enable verbose logging
+
+        Returns:
+            Cached markdown, or None on a miss, an unreadable entry or when
+            caching is disabled
+        """
+        if cache_path is None:
+            return None
+
+        try:
+            cached = cache_path.read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+        # Empty responses are never written, so an empty entry is a truncated file
+        if not cached:
+            return None
+
+        if verbose:
+            print(f"Using cached model response: {cache_path}", file=sys.stderr)
+        return cached
+
+    def _write_cached_response(self, cache_path: Path | None, content: str) -> None:
+        """Store a raw model response, replacing the entry atomically.
+
+        Caching is best-effort: a cache directory that can't be written is
+        logged at debug level and otherwise ignored.
+
+        Args:
+            cache_path: Cache entry from _response_cache_path
+            content: Raw markdown returned by the model
+        """
+        if cache_path is None or not content:
+            return
+
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per write, so threads storing the same key don't collide
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.debug("Could not write response cache %s: %s", cache_path, e)
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink(missing_ok=True)
 
     def process(self, input_path: Path | str, verbose: bool = False, debug: bool = False, debug_dir: Path | None = None) -> str:
         """Process a recipe from either an image file or URL.
@@ -80,11 +348,145 @@ class RecipeProcessor:
                 input_path = Path(input_path)
             return self.process_image(input_path, verbose=verbose, debug=debug, debug_dir=debug_dir)
 
+    def process_batch(
+        self,
+        input_paths: list[Path | str],
+        concurrency: int = 8,
+        verbose: bool = False,
+        debug: bool = False,
+        debug_dir: Path | None = None,
+    ) -> list[str]:
+        """Process several recipes concurrently.
+
+        Each recipe is dominated by API round-trips, so running them on a
+        bounded thread pool overlaps the waits while sharing this processor's
+        pooled HTTP client. Results come back as soon as the requests finish and
+        any failure is raised; for half-price, asynchronous processing of image
+        backlogs see process_images_with_batch_api.
+
+        Args:
+            input_paths: Image file paths and/or URL strings
+            concurrency: Maximum number of recipes processed at once
+            verbose: Enable verbose logging
+            debug: Enable debug mode (shows prompts and responses)
+            debug_dir: Directory to write debug files (default: current directory)
+
+        Returns:
+            Markdown content for each input, in input order
+        """
+        if len(input_paths) <= 1:
+            return [self.process(p, verbose=verbose, debug=debug, debug_dir=debug_dir) for p in input_paths]
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(input_paths))) as executor:
+            return list(executor.map(
+                lambda p: self.process(p, verbose=verbose, debug=debug, debug_dir=debug_dir),
+                input_paths,
+            ))
+
+    async def process_many(
+        self,
+        input_paths: list[Path | str],
+        concurrency: int = 8,
+        verbose: bool = False,
+        debug: bool = False,
+        debug_dir: Path | None = None,
+    ) -> list[str]:
+        """Process several recipes concurrently from asyncio code.
+
+        Runs process_batch in a worker thread, so it doesn't block an event
+        loop while keeping the same ordering, concurrency limit and error
+        behaviour.
+
+        Args:
+            input_paths: Image file paths and/or URL strings
+            concurrency: Maximum number of recipes processed at once
+            verbose: Enable verbose logging
+            debug: Enable debug mode (shows prompts and responses)
+            debug_dir: Directory to write debug files (default: current directory)
+
+        Returns:
+            Markdown content for each input, in input order
+        """
+        return await asyncio.to_thread(
+            self.process_batch, input_paths, concurrency=concurrency, verbose=verbose, debug=debug, debug_dir=debug_dir
+        )
+
+    def process_images_with_batch_api(
+        self, image_paths: list[Path | str], poll_interval: float = BATCH_POLL_INTERVAL, verbose: bool = False
+    ) -> list[str | None]:
+        """Process many recipe images through the Message Batches API.
+
+        Unlike process_batch, which makes regular concurrent requests, batched
+        requests are billed at half price but complete asynchronously (usually
+        within minutes, at most 24 hours), so this suits converting a backlog of
+        photos rather than interactive use. Failed requests come back as None
+        instead of raising. Images are submitted BATCH_MAX_IMAGES per batch, so
+        only one batch's encoded images are in memory at a time. Blocks until
+        every batch ends.
+
+        Args:
+            image_paths: Paths to recipe image files
+            poll_interval: Seconds to wait between batch status checks
+            verbose: Enable verbose logging
+
+        Returns:
+            Markdown content for each image in input order, or None for images
+            whose request failed or expired
+        """
+        if not image_paths:
+            return []
+
+        system = _cached_system_prompt(self._image_prompt)
+        batches = []
+        for start in range(0, len(image_paths), BATCH_MAX_IMAGES):
+            # custom_id is the index into image_paths, unique across all batches
+            requests: list[Request] = [
+                {
+                    "custom_id": str(index),
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": 4000,
+                        "system": system,
+                        "messages": [
+                            {
+                                "role": "user",
+                                "content": [cast(ImageBlockParam, self._encode_image(Path(image_paths[index])))],
+                            }
+                        ],
+                    },
+                }
+                for index in range(start, min(start + BATCH_MAX_IMAGES, len(image_paths)))
+            ]
+            batch = self.client.messages.batches.create(requests=requests)
+            batches.append(batch)
+            if verbose:
+                print(f"Submitted message batch {batch.id} with {len(requests)} images", file=sys.stderr)
+
+        results: list[str | None] = [None] * len(image_paths)
+        for batch in batches:
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+                if verbose:
+                    counts = batch.request_counts
+                    print(f"Batch {batch.id}: {counts.processing} processing, {counts.succeeded} succeeded", file=sys.stderr)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                if entry.result.type == "succeeded":
+                    message = entry.result.message
+                    # Only text blocks carry the recipe; skip any other block types
+                    markdown = "".join(block.text for block in message.content if isinstance(block, TextBlock))
+                    results[int(entry.custom_id)] = self._apply_formatting(markdown)
+                elif verbose:
+                    print(f"Batch request for {image_paths[int(entry.custom_id)]} {entry.result.type}", file=sys.stderr)
+
+        return results
+
     def process_url(self, url: str, verbose: bool = False, debug: bool = False, debug_dir: Path | None = None) -> str:
         """Process a recipe from a URL.
 
         Args:
-            url: URL to recipe webpage (including YouTube videos)
+            url: URL to recipe webpage (including YouTube videos) or image file
             verbose: Enable verbose logging
             debug: Enable debug mode (shows prompts and responses)
             debug_dir: Directory to write debug files (default: current directory)
@@ -93,10 +495,13 @@ class RecipeProcessor:
             Markdown formatted recipe content
         """
         if verbose:
-            import sys
             print(f"Fetching recipe from URL: {url}", file=sys.stderr)
 
         try:
+            # Direct links to images are fetched by the API itself, nothing to download here
+            if is_image_url(url):
+                return self.process_image_url(url, verbose=verbose, debug=debug, debug_dir=debug_dir)
+
             # Check if this is a YouTube URL
             if YouTubeRecipeExtractor.is_youtube_url(url):
                 return self._process_youtube_url(url, verbose=verbose, debug=debug, debug_dir=debug_dir)
@@ -111,7 +516,6 @@ class RecipeProcessor:
                     verbose=verbose,
                 )
                 if verbose:
-                    import sys
                     if method != "original":
                         print(f"[PRINT-URL] ✓ Using print-friendly URL | Method: {method}", file=sys.stderr)
                         print(f"[PRINT-URL] URL: {best_url}", file=sys.stderr)
@@ -120,65 +524,30 @@ class RecipeProcessor:
             else:
                 best_url = url
                 if verbose:
-                    import sys
                     print(f"[PRINT-URL] Print URL detection disabled", file=sys.stderr)
 
             # Fetch the webpage
             html = self.url_extractor.fetch_page(best_url)
             if verbose:
-                import sys
                 print(f"Downloaded {len(html)} bytes of HTML", file=sys.stderr)
 
             # Extract clean text content
             content = self.url_extractor.extract_content(html)
 
-            # Limit content to prevent token overflow
-            # Using 20000 chars (~5000 tokens) to handle longer recipes
-            # Claude 3.5 Sonnet has 200k token context, so this is safe
-            max_chars = 20000
-            original_length = len(content)
-            if len(content) > max_chars:
-                if verbose or debug:
-                    import sys
-                    print(
-                        f"WARNING: Content too long ({len(content)} chars), truncating to {max_chars}",
-                        file=sys.stderr,
-                    )
-                    print(
-                        f"WARNING: Recipe content may be incomplete. Consider using a recipe site with cleaner HTML.",
-                        file=sys.stderr,
-                    )
-                content = content[:max_chars]
-
             if verbose:
-                import sys
                 print(f"Extracted content: {len(content)} characters", file=sys.stderr)
-                if original_length > max_chars:
-                    print(f"Truncated from {original_length} characters", file=sys.stderr)
 
             # Send to Claude for processing
             if verbose:
-                import sys
                 print(f"Processing with AI model: {self.model}", file=sys.stderr)
 
             markdown = self._extract_recipe_from_url(content, url, verbose=verbose, debug=debug, debug_dir=debug_dir)
 
             if verbose:
-                import sys
                 print(f"Raw markdown length: {len(markdown)} characters", file=sys.stderr)
 
             # Apply deterministic formatting if enabled
-            if self.apply_formatting and self.formatter:
-                if verbose:
-                    import sys
-                    print(f"Applying deterministic formatting...", file=sys.stderr)
-                markdown = self.formatter.format(markdown)
-                markdown = self.formatter.renumber_instructions(markdown)
-                if verbose:
-                    import sys
-                    print(f"Formatted markdown length: {len(markdown)} characters", file=sys.stderr)
-
-            return markdown
+            return self._apply_formatting(markdown, verbose=verbose)
 
         except Exception as e:
             raise Exception(f"Failed to process recipe from URL: {str(e)}")
@@ -196,7 +565,6 @@ class RecipeProcessor:
             Markdown formatted recipe content
         """
         if verbose:
-            import sys
             print(f"[YOUTUBE] Processing YouTube video", file=sys.stderr)
 
         try:
@@ -204,23 +572,10 @@ class RecipeProcessor:
             description, metadata = self.youtube_extractor.fetch_video_info(url, verbose=verbose)
 
             if verbose:
-                import sys
                 print(f"[YOUTUBE] Video: {metadata['title']}", file=sys.stderr)
                 print(f"[YOUTUBE] Channel: {metadata['channel']}", file=sys.stderr)
                 print(f"[YOUTUBE] Description length: {len(description)} characters", file=sys.stderr)
 
-            # Limit content to prevent token overflow
-            max_chars = 20000
-            original_length = len(description)
-            if len(description) > max_chars:
-                if verbose or debug:
-                    import sys
-                    print(
-                        f"WARNING: Description too long ({len(description)} chars), truncating to {max_chars}",
-                        file=sys.stderr,
-                    )
-                description = description[:max_chars]
-
             # Add metadata context to the description for better extraction
             content = f"""Video Title: {metadata['title']}
 Channel: {metadata['channel']}
@@ -229,7 +584,6 @@ Description:
 {description}"""
 
             if verbose:
-                import sys
                 print(f"Processing with AI model: {self.model}", file=sys.stderr)
 
             # Send to Claude for processing with enhanced prompt for YouTube
@@ -243,25 +597,74 @@ Description:
             )
 
             if verbose:
-                import sys
                 print(f"Raw markdown length: {len(markdown)} characters", file=sys.stderr)
 
             # Apply deterministic formatting if enabled
-            if self.apply_formatting and self.formatter:
-                if verbose:
-                    import sys
-                    print(f"Applying deterministic formatting...", file=sys.stderr)
-                markdown = self.formatter.format(markdown)
-                markdown = self.formatter.renumber_instructions(markdown)
-                if verbose:
-                    import sys
-                    print(f"Formatted markdown length: {len(markdown)} characters", file=sys.stderr)
-
-            return markdown
+            return self._apply_formatting(markdown, verbose=verbose)
 
         except Exception as e:
             raise Exception(f"Failed to process recipe from YouTube: {str(e)}")
 
+    def _count_tokens(self, text: str) -> int:
+        """Count the input tokens a user message containing text would use.
+
+        Args:
+            text: Message text
+
+        Returns:
+            Input token count reported by the API
+        """
+        response = self.client.messages.count_tokens(
+            model=self.model,
+            messages=[{"role": "user", "content": text}],
+        )
+        return response.input_tokens
+
+    def _trim_to_token_budget(self, text: str, verbose: bool = False) -> str:
+        """Trim text so it fits within max_input_tokens.
+
+        Text is first cut to a character estimate of the budget, so tokens are
+        only counted (with the API) for text near the boundary. Text still over
+        budget is cut in proportion to the measured chars-per-token ratio and
+        recounted, which usually takes a single extra request.
+
+        Args:
+            text: Extracted page or description text
+            verbose: Print a warning when text is trimmed
+
+        Returns:
+            Text within the token budget (or as close as the recount limit allows)
+        """
+        budget = self.max_input_tokens
+        original_length = len(text)
+        text = text[: budget * CHARS_PER_TOKEN_FALLBACK]
+        if len(text) <= budget * CHARS_PER_TOKEN_MIN:
+            return text
+
+        size = ""
+        try:
+            tokens = self._count_tokens(text)
+            rounds = 0
+            while tokens > budget and rounds < TOKEN_TRIM_MAX_ROUNDS:
+                # Aim slightly under the budget so one recount normally suffices
+                text = text[: int(len(text) * budget / tokens * 0.98)]
+                tokens = self._count_tokens(text)
+                rounds += 1
+            size = f", {tokens} tokens"
+            if tokens > budget:
+                size += f", still over the {budget} token budget after {rounds} recounts"
+        except APIError as e:
+            size = f", token count unavailable: {e}"
+
+        if verbose and len(text) < original_length:
+            print(
+                f"WARNING: Content too long ({original_length} chars), truncated to {len(text)} chars{size}. "
+                f"Recipe content may be incomplete.",
+                file=sys.stderr,
+            )
+
+        return text
+
     def process_image(self, image_path: Path, verbose: bool = False, debug: bool = False, debug_dir: Path | None = None) -> str:
         """Process a recipe image and return markdown content.
 
@@ -276,31 +679,112 @@ Description:
         """
         # Load and encode image
         image_data = self._encode_image(image_path)
+        return self._process_encoded_image(image_data, verbose=verbose, debug=debug, debug_dir=debug_dir)
+
+    def process_image_bytes(
+        self, image_bytes: bytes, suffix: str = ".jpg", verbose: bool = False, debug: bool = False, debug_dir: Path | None = None
+    ) -> str:
+        """Process a recipe image held in memory and return markdown content.
+
+        Args:
+            image_bytes: Raw image file contents
+            suffix: Original file extension (e.g., ".png"), used to pick the media type
+            verbose: Enable verbose logging
+            debug: Enable debug mode (shows prompts and responses)
+            debug_dir: Directory to write debug files (default: current directory)
+
+        Returns:
+            Markdown formatted recipe content
+        """
+        image_data = self._encode_image_bytes(image_bytes, suffix)
+        return self._process_encoded_image(image_data, verbose=verbose, debug=debug, debug_dir=debug_dir)
+
+    def process_image_base64(
+        self, encoded: str, suffix: str = ".jpg", verbose: bool = False, debug: bool = False, debug_dir: Path | None = None
+    ) -> str:
+        """Process an already base64-encoded recipe image and return markdown content.
+
+        Args:
+            encoded: Base64-encoded image file contents
+            suffix: Original file extension (e.g., ".png"), used to pick the media type
+            verbose: Enable verbose logging
+            debug: Enable debug mode (shows prompts and responses)
+            debug_dir: Directory to write debug files (default: current directory)
+
+        Returns:
+            Markdown formatted recipe content
+        """
+        image_data = self._build_image_block(encoded, suffix)
+        return self._process_encoded_image(image_data, verbose=verbose, debug=debug, debug_dir=debug_dir)
+
+    def process_image_url(self, url: str, verbose: bool = False, debug: bool = False, debug_dir: Path | None = None) -> str:
+        """Process a recipe image hosted at a URL and return markdown content.
+
+        The image is referenced by URL in the API request, so it is never
+        downloaded or base64-encoded locally.
+
+        Args:
+            url: HTTP(S) URL of the image file
+            verbose: Enable verbose logging
+            debug: Enable debug mode (shows prompts and responses)
+            debug_dir: Directory to write debug files (default: current directory)
+
+        Returns:
+            Markdown formatted recipe content
+        """
+        image_data = {"type": "image", "source": {"type": "url", "url": url}}
+        return self._process_encoded_image(image_data, verbose=verbose, debug=debug, debug_dir=debug_dir)
+
+    def _process_encoded_image(
+        self, image_data: dict[str, Any], verbose: bool = False, debug: bool = False, debug_dir: Path | None = None
+    ) -> str:
+        """Extract and format a recipe from an encoded image.
+
+        Args:
+            image_data: Encoded image data
+            verbose: Enable verbose logging
+            debug: Enable debug mode (shows prompts and responses)
+            debug_dir: Directory to write debug files (default: current directory)
+
+        Returns:
+            Markdown formatted recipe content
+        """
         if verbose:
-            import sys
-            print(f"Encoded image size: {len(image_data['source']['data'])} bytes", file=sys.stderr)
+            if image_data["source"]["type"] == "url":
+                print(f"Image URL: {image_data['source']['url']}", file=sys.stderr)
+            else:
+                print(f"Encoded image size: {len(image_data['source']['data'])} bytes", file=sys.stderr)
 
         # Get structured recipe data from Claude
         if verbose:
-            import sys
             print(f"Calling AI model: {self.model}", file=sys.stderr)
 
         markdown = self._extract_recipe(image_data, verbose=verbose, debug=debug, debug_dir=debug_dir)
 
         if verbose:
-            import sys
             print(f"Raw markdown length: {len(markdown)} characters", file=sys.stderr)
 
         # Apply deterministic formatting if enabled
-        if self.apply_formatting and self.formatter:
-            if verbose:
-                import sys
-                print(f"Applying deterministic formatting...", file=sys.stderr)
-            markdown = self.formatter.format(markdown)
-            markdown = self.formatter.renumber_instructions(markdown)
-            if verbose:
-                import sys
-                print(f"Formatted markdown length: {len(markdown)} characters", file=sys.stderr)
+        return self._apply_formatting(markdown, verbose=verbose)
+
+    def _apply_formatting(self, markdown: str, verbose: bool = False) -> str:
+        """Apply deterministic formatting to extracted markdown, if enabled.
+
+        Args:
+            markdown: Raw markdown returned by the model
+            verbose: Enable verbose logging
+
+        Returns:
+            Formatted markdown, or the input unchanged when formatting is disabled
+        """
+        if not (self.apply_formatting and self.formatter):
+            return markdown
+
+        if verbose:
+            print("Applying deterministic formatting...", file=sys.stderr)
+        markdown = self.formatter.format_and_renumber(markdown)
+        if verbose:
+            print(f"Formatted markdown length: {len(markdown)} characters", file=sys.stderr)
 
         return markdown
 
@@ -313,29 +797,44 @@ Description:
         Returns:
             Dictionary with image data for API
         """
-        # Open and potentially convert image format
-        with Image.open(image_path) as img:
-            # Convert to RGB if necessary
-            if img.mode not in ("RGB", "RGBA"):
-                img = img.convert("RGB")
-
-            # Read file bytes directly (no compression)
-            with open(image_path, "rb") as f:
-                image_bytes = f.read()
-
-        # Determine media type
-        suffix = image_path.suffix.lower()
-        media_type_map = {
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-        }
-        media_type = media_type_map.get(suffix, "image/jpeg")
+        suffix = image_path.suffix
+        if not self.resize_images and image_path.stat().st_size > STREAM_ENCODE_MIN_BYTES:
+            # Never hold the raw file and its encoding in memory at the same time
+            return self._build_image_block(encode_file_base64(image_path), suffix)
+
+        image_bytes = image_path.read_bytes()
+        if self.resize_images:
+            image_bytes, suffix = downscale_image(image_bytes, suffix)
 
-        # Encode to base64
-        encoded = base64.standard_b64encode(image_bytes).decode("utf-8")
+        return self._encode_image_bytes(image_bytes, suffix)
+
+    def _encode_image_bytes(self, image_bytes: bytes, suffix: str) -> dict[str, Any]:
+        """Encode in-memory image bytes for API submission.
+
+        Args:
+            image_bytes: Raw image file contents
+            suffix: Original file extension, used to pick the media type
+
+        Returns:
+            Dictionary with image data for API
+        """
+        # The API takes the original file bytes, so no decode is needed here;
+        # base64 output is pure ASCII, which skips UTF-8 validation
+        encoded = base64.b64encode(image_bytes).decode("ascii")
+
+        return self._build_image_block(encoded, suffix)
+
+    def _build_image_block(self, encoded: str, suffix: str) -> dict[str, Any]:
+        """Build the API image content block for base64-encoded image data.
+
+        Args:
+            encoded: Base64-encoded image file contents
+            suffix: Original file extension, used to pick the media type
+
+        Returns:
+            Dictionary with image data for API
+        """
+        media_type = IMAGE_MEDIA_TYPES.get(suffix.lower(), "image/jpeg")
 
         return {
             "type": "image",
@@ -346,19 +845,13 @@ Description:
             },
         }
 
-    def _extract_recipe(self, image_data: dict[str, Any], verbose: bool = False, debug: bool = False, debug_dir: Path | None = None) -> str:
-        """Extract recipe information using Claude Vision API.
-
-        Args:
-            image_data: Encoded image data
-            verbose: Enable verbose logging
-            debug: Enable debug mode (shows prompts and responses)
-            debug_dir: Directory to write debug files (default: current directory)
+    def _build_image_prompt(self) -> str:
+        """Build the image extraction prompt from the loaded template.
 
         Returns:
-            Markdown formatted recipe
+            Prompt text sent alongside every recipe image
         """
-        prompt = f"""Analyze this recipe image and extract the recipe information into a structured markdown format.
+        return f"""Analyze this recipe image and extract the recipe information into a structured markdown format.
 
 You MUST follow this exact template structure:
 
@@ -368,11 +861,7 @@ Instructions:
 - Extract all text accurately from the image, preserving measurements and quantities
 - Fill in the template with the actual recipe information
 - Analyze the recipe and fill in the properties line with appropriate values:
-  * Cuisine: Choose from (Moroccan, Caribbean, Vietnamese, Turkish, Lebanese, Brazilian, Korean, Spanish, Thai, Indian, Southern, Greek, Mexican, French, American, Italian, Chinese)
-  * Protein: Choose from (Fish, Veg, Beef, Pork, Turkey, Chicken) - can be multiple separated by commas
-  * Course: Choose from (Dinner, Lunch, Breakfast, Sauce, Salad, Main Course, Soup, Dessert, Side, Appetizer, Beverage)
-  * Method: Choose from (Smoking, Baking, Blanching, Microwaving, Sautéing, Broiling, No-Cook, Marinating, Pickling, Braising, Steaming, Oven, Fry, Roast, Stove Top, Grill, BBQ, Crockpot) - can be multiple separated by commas
-  * Effort: Estimate effort level - use 🔪 for quick/easy recipes (under 1 hour), 🔪🔪 for medium effort (over 1 hour), 🔪🔪🔪 for high effort (multi-day, overnight, or long marinating)
+{_PROPERTY_OPTIONS_GUIDE}
   * Rating: Leave blank (will be filled by user)
   * Cook Time: Extract from image or estimate total cooking time in minutes
 - Use the exact section headers shown in the template including horizontal rules (---)
@@ -407,17 +896,139 @@ For Directions:
 5. Pay special attention to capture the LAST direction step - this is commonly missed
 6. Include all sub-steps and details from each direction
 
-IMPORTANT FORMATTING GUIDELINES:
-- Write out abbreviated units (e.g., "2 tbsp" → "2 tablespoon", "1 tsp" → "1 teaspoon")
-- Use ASCII fractions instead of unicode (e.g., "½" → "1/2", "¼" → "1/4")
-- Use explicit numbered steps for directions (1., 2., 3., etc.) with blank lines between steps
-- Pluralize units when quantity is greater than 1 (e.g., "2 tablespoons", "3 cups")
-- Always include horizontal rules (---) between sections"""
+{_FORMATTING_GUIDELINES}"""
 
-        if debug:
-            import sys
-            from pathlib import Path
+    def _build_url_system_prompt(self) -> str:
+        """Build the static webpage extraction instructions from the loaded template.
 
+        Returns:
+            System prompt text sent ahead of the per-request source content
+        """
+        return f"""You MUST follow this exact template structure:
+
+{self.template}
+
+Instructions:
+- Extract ONLY recipe information (ignore ads, navigation, comments, related recipes)
+- Fill in the template with the actual recipe information
+- Analyze the recipe and fill in the properties line with appropriate values:
+{_PROPERTY_OPTIONS_GUIDE}
+  * Rating: Leave blank (will be filled by user)
+  * Cook Time: Extract from content or estimate total cooking time in minutes
+- Use the exact section headers shown in the template including horizontal rules (---)
+- For Ingredients: Use a markdown table with three columns: Ingredient | Measurement | Method
+  * Ingredient column: ingredient name (e.g., "all-purpose flour", "butter", "onions")
+  * Measurement column: quantity and unit (e.g., "2 cups", "1 tablespoon", "3 ounces") - leave blank if no measurement
+  * IMPORTANT: Use US Customary units ONLY - do NOT include metric conversions (no grams, milliliters, etc.)
+  * Method column: preparation/state (e.g., "finely chopped", "melted", "room temperature") - leave blank if not applicable
+  * If the recipe has multiple sections (e.g., "For the dough", "For the filling"), use ### subheadings followed by separate tables
+- For Directions: Use numbered lists (1., 2., 3., etc.) with clear, actionable steps
+- If the recipe has distinct phases (e.g., "For the dough", "For the filling"), use ### subheadings to organize the directions
+- Add a blank line between each numbered direction step
+- For Photos, Links, and Notes sections: Only include the heading and horizontal rules. Add content ONLY if present in the extracted content
+- For Nutrition section: Estimate macros per serving based on the ingredients and quantities. Calculate rough estimates for calories, protein, carbs, and fat
+- Be precise with ingredient amounts and direction details
+- If information is missing, omit that section entirely
+- Ensure measurements are clear and complete
+- Clean up any formatting issues or typos from source
+- Do not add any text outside of this template structure
+- Include all sections: Ingredients, Directions, Notes, Links, Nutrition, and Photos with horizontal rules (---) between them
+
+CRITICAL - COMPLETENESS VERIFICATION:
+For Ingredients:
+1. First, locate and count ALL ingredients in the source content's ingredients list
+2. Extract every single ingredient - do not skip any
+3. After extraction, verify your ingredient count matches the source
+4. If the source shows "X ingredients" or has a numbered/bulleted list, ensure you have exactly that many
+5. Double-check you haven't missed any ingredients, especially those at the end of lists
+
+For Directions:
+1. First, locate and count ALL direction steps in the source content
+2. Extract every single step - do not skip any, especially not the final steps
+3. If the source has numbered directions, preserve the original numbering (don't renumber)
+4. After extraction, verify your step count matches the source
+5. Pay special attention to capture the LAST direction step - this is commonly missed
+6. Include all sub-steps and details from each direction
+
+{_FORMATTING_GUIDELINES}"""
+
+    def _build_youtube_system_prompt(self) -> str:
+        """Build the static YouTube extraction instructions from the loaded template.
+
+        Returns:
+            System prompt text sent ahead of the per-request source content
+        """
+        return f"""You MUST follow this exact template structure:
+
+{self.template}
+
+Instructions:
+- Extract ONLY recipe information from the description (ignore timestamps, social media links, promotional content, video timestamps)
+- YouTube descriptions often contain recipe info after intro text and before social links - focus on the recipe content
+- Fill in the template with the actual recipe information
+- Analyze the recipe and fill in the properties line with appropriate values:
+{_PROPERTY_OPTIONS_GUIDE}
+  * Rating: Leave blank (will be filled by user)
+  * Cook Time: Extract from description or estimate total cooking time in minutes
+- Use the exact section headers shown in the template including horizontal rules (---)
+- For Ingredients: Use a markdown table with three columns: Ingredient | Measurement | Method
+  * Ingredient column: ingredient name (e.g., "all-purpose flour", "butter", "onions")
+  * Measurement column: quantity and unit (e.g., "2 cups", "1 tablespoon", "3 ounces") - leave blank if no measurement
+  * IMPORTANT: Use US Customary units ONLY - do NOT include metric conversions (no grams, milliliters, etc.)
+  * Method column: preparation/state (e.g., "finely chopped", "melted", "room temperature") - leave blank if not applicable
+  * If the recipe has multiple sections (e.g., "For the dough", "For the filling"), use ### subheadings followed by separate tables
+- For Directions: Use numbered lists (1., 2., 3., etc.) with clear, actionable steps
+- If the recipe has distinct phases (e.g., "For the dough", "For the filling"), use ### subheadings to organize the directions
+- Add a blank line between each numbered direction step
+- For Links section: Include the YouTube video URL
+- For Photos, Notes sections: Only include the heading and horizontal rules. Add content ONLY if present in the description
+- For Nutrition section: Estimate macros per serving based on the ingredients and quantities. Calculate rough estimates for calories, protein, carbs, and fat
+- Be precise with ingredient amounts and direction details
+- If information is missing, omit that section entirely
+- Ensure measurements are clear and complete
+- Clean up any formatting issues from source
+- Do not add any text outside of this template structure
+- Include all sections: Ingredients, Directions, Notes, Links, Nutrition, and Photos with horizontal rules (---) between them
+
+CRITICAL - COMPLETENESS VERIFICATION:
+For Ingredients:
+1. First, locate and count ALL ingredients in the description's ingredients list
+2. Extract every single ingredient - do not skip any
+3. After extraction, verify your ingredient count matches the source
+4. If the description shows "X ingredients" or has a numbered/bulleted list, ensure you have exactly that many
+5. Double-check you haven't missed any ingredients, especially those at the end of lists
+
+For Directions:
+1. First, locate and count ALL direction steps in the description
+2. Extract every single step - do not skip any, especially not the final steps
+3. If the description has numbered directions, preserve the original numbering (don't renumber)
+4. After extraction, verify your step count matches the source
+5. Pay special attention to capture the LAST direction step - this is commonly missed
+6. Include all sub-steps and details from each direction
+
+{_FORMATTING_GUIDELINES}"""
+
+    def _extract_recipe(self, image_data: dict[str, Any], verbose: bool = False, debug: bool = False, debug_dir: Path | None = None) -> str:
+        """Extract recipe information using Claude Vision API.
+
+        Args:
+            image_data: Encoded image data
+            verbose: Enable verbose logging
+            debug: Enable debug mode (shows prompts and responses)
+            debug_dir: Directory to write debug files (default: current directory)
+
+        Returns:
+            Markdown formatted recipe
+        """
+        # Static for a given template, so built once in __init__
+        prompt = self._image_prompt
+
+        cache_path = self._response_cache_path(prompt, image_data["source"])
+        cached = self._read_cached_response(cache_path, verbose=verbose)
+        if cached is not None:
+            return cached
+
+        if debug:
             # Determine debug directory
             base_dir = debug_dir if debug_dir else Path.cwd()
 
@@ -429,24 +1040,25 @@ IMPORTANT FORMATTING GUIDELINES:
                 f.write("="*80 + "\n\n")
                 f.write(prompt)
                 f.write(f"\n\n{'='*80}\n")
-                f.write(f"IMAGE DATA: {len(image_data['source']['data'])} bytes (base64 encoded)\n")
+                if image_data["source"]["type"] == "url":
+                    f.write(f"IMAGE URL: {image_data['source']['url']}\n")
+                else:
+                    f.write(f"IMAGE DATA: {len(image_data['source']['data'])} bytes (base64 encoded)\n")
                 f.write("="*80 + "\n")
 
             print(f"Debug: Prompt written to {debug_prompt_file}", file=sys.stderr)
 
-        import time
         start_time = time.time()
 
         message = self.client.messages.create(
             model=self.model,
             max_tokens=4000,
+            # Static instructions go in a cached system prompt so repeat calls reuse them
+            system=_cached_system_prompt(prompt),
             messages=[
                 {
                     "role": "user",
-                    "content": [
-                        image_data,
-                        {"type": "text", "text": prompt},
-                    ],
+                    "content": [image_data],
                 }
             ],
         )
@@ -454,9 +1066,14 @@ IMPORTANT FORMATTING GUIDELINES:
         elapsed = time.time() - start_time
 
         if verbose:
-            import sys
             print(f"⏱️  API call completed in {elapsed:.2f}s", file=sys.stderr)
             print(f"📊 Input tokens: {message.usage.input_tokens}", file=sys.stderr)
+            if message.usage.cache_read_input_tokens or message.usage.cache_creation_input_tokens:
+                print(
+                    f"📊 Cached prompt tokens: {message.usage.cache_read_input_tokens or 0} read, "
+                    f"{message.usage.cache_creation_input_tokens or 0} written",
+                    file=sys.stderr,
+                )
             print(f"📊 Output tokens: {message.usage.output_tokens}", file=sys.stderr)
 
             # Calculate approximate cost
@@ -476,11 +1093,9 @@ IMPORTANT FORMATTING GUIDELINES:
 
         # Extract text from response
         content = message.content[0].text if message.content else ""
+        self._write_cached_response(cache_path, content)
 
         if debug:
-            import sys
-            from pathlib import Path
-
             # Determine debug directory
             base_dir = debug_dir if debug_dir else Path.cwd()
 
@@ -510,74 +1125,23 @@ IMPORTANT FORMATTING GUIDELINES:
         Returns:
             Markdown formatted recipe
         """
+        # Keyed on the untrimmed content so cache hits skip token counting
+        cache_path = self._response_cache_path(
+            self._url_system_prompt, {"url": url, "content": content, "max_input_tokens": self.max_input_tokens}
+        )
+        cached = self._read_cached_response(cache_path, verbose=verbose)
+        if cached is not None:
+            return cached
+
+        content = self._trim_to_token_budget(content, verbose=verbose or debug)
         prompt = f"""Extract the recipe from the following webpage content and format it into a structured markdown format.
 
 Source URL: {url}
 
 Content:
-{content}
-
-You MUST follow this exact template structure:
-
-{self.template}
-
-Instructions:
-- Extract ONLY recipe information (ignore ads, navigation, comments, related recipes)
-- Fill in the template with the actual recipe information
-- Analyze the recipe and fill in the properties line with appropriate values:
-  * Cuisine: Choose from (Moroccan, Caribbean, Vietnamese, Turkish, Lebanese, Brazilian, Korean, Spanish, Thai, Indian, Southern, Greek, Mexican, French, American, Italian, Chinese)
-  * Protein: Choose from (Fish, Veg, Beef, Pork, Turkey, Chicken) - can be multiple separated by commas
-  * Course: Choose from (Dinner, Lunch, Breakfast, Sauce, Salad, Main Course, Soup, Dessert, Side, Appetizer, Beverage)
-  * Method: Choose from (Smoking, Baking, Blanching, Microwaving, Sautéing, Broiling, No-Cook, Marinating, Pickling, Braising, Steaming, Oven, Fry, Roast, Stove Top, Grill, BBQ, Crockpot) - can be multiple separated by commas
-  * Effort: Estimate effort level - use 🔪 for quick/easy recipes (under 1 hour), 🔪🔪 for medium effort (over 1 hour), 🔪🔪🔪 for high effort (multi-day, overnight, or long marinating)
-  * Rating: Leave blank (will be filled by user)
-  * Cook Time: Extract from content or estimate total cooking time in minutes
-- Use the exact section headers shown in the template including horizontal rules (---)
-- For Ingredients: Use a markdown table with three columns: Ingredient | Measurement | Method
-  * Ingredient column: ingredient name (e.g., "all-purpose flour", "butter", "onions")
-  * Measurement column: quantity and unit (e.g., "2 cups", "1 tablespoon", "3 ounces") - leave blank if no measurement
-  * IMPORTANT: Use US Customary units ONLY - do NOT include metric conversions (no grams, milliliters, etc.)
-  * Method column: preparation/state (e.g., "finely chopped", "melted", "room temperature") - leave blank if not applicable
-  * If the recipe has multiple sections (e.g., "For the dough", "For the filling"), use ### subheadings followed by separate tables
-- For Directions: Use numbered lists (1., 2., 3., etc.) with clear, actionable steps
-- If the recipe has distinct phases (e.g., "For the dough", "For the filling"), use ### subheadings to organize the directions
-- Add a blank line between each numbered direction step
-- For Photos, Links, and Notes sections: Only include the heading and horizontal rules. Add content ONLY if present in the extracted content
-- For Nutrition section: Estimate macros per serving based on the ingredients and quantities. Calculate rough estimates for calories, protein, carbs, and fat
-- Be precise with ingredient amounts and direction details
-- If information is missing, omit that section entirely
-- Ensure measurements are clear and complete
-- Clean up any formatting issues or typos from source
-- Do not add any text outside of this template structure
-- Include all sections: Ingredients, Directions, Notes, Links, Nutrition, and Photos with horizontal rules (---) between them
-
-CRITICAL - COMPLETENESS VERIFICATION:
-For Ingredients:
-1. First, locate and count ALL ingredients in the source content's ingredients list
-2. Extract every single ingredient - do not skip any
-3. After extraction, verify your ingredient count matches the source
-4. If the source shows "X ingredients" or has a numbered/bulleted list, ensure you have exactly that many
-5. Double-check you haven't missed any ingredients, especially those at the end of lists
-
-For Directions:
-1. First, locate and count ALL direction steps in the source content
-2. Extract every single step - do not skip any, especially not the final steps
-3. If the source has numbered directions, preserve the original numbering (don't renumber)
-4. After extraction, verify your step count matches the source
-5. Pay special attention to capture the LAST direction step - this is commonly missed
-6. Include all sub-steps and details from each direction
-
-IMPORTANT FORMATTING GUIDELINES:
-- Write out abbreviated units (e.g., "2 tbsp" → "2 tablespoon", "1 tsp" → "1 teaspoon")
-- Use ASCII fractions instead of unicode (e.g., "½" → "1/2", "¼" → "1/4")
-- Use explicit numbered steps for directions (1., 2., 3., etc.) with blank lines between steps
-- Pluralize units when quantity is greater than 1 (e.g., "2 tablespoons", "3 cups")
-- Always include horizontal rules (---) between sections"""
+{content}"""
 
         if debug:
-            import sys
-            from pathlib import Path
-
             # Determine debug directory
             base_dir = debug_dir if debug_dir else Path.cwd()
 
@@ -587,18 +1151,20 @@ IMPORTANT FORMATTING GUIDELINES:
                 f.write("="*80 + "\n")
                 f.write("DEBUG MODE - URL EXTRACTION - PROMPT\n")
                 f.write("="*80 + "\n\n")
+                f.write(self._url_system_prompt)
+                f.write("\n\n" + "="*80 + "\n\n")
                 f.write(prompt)
                 f.write("\n\n" + "="*80 + "\n")
 
             print(f"Debug: Prompt (including extracted webpage content) written to {debug_prompt_file}", file=sys.stderr)
 
-        import time
-
         start_time = time.time()
 
         message = self.client.messages.create(
             model=self.model,
             max_tokens=4000,
+            # Static template and instructions go in a cached system prompt so repeat calls reuse them
+            system=_cached_system_prompt(self._url_system_prompt),
             messages=[
                 {
                     "role": "user",
@@ -610,10 +1176,14 @@ IMPORTANT FORMATTING GUIDELINES:
         elapsed = time.time() - start_time
 
         if verbose:
-            import sys
-
             print(f"API call completed in {elapsed:.2f}s", file=sys.stderr)
             print(f"Input tokens: {message.usage.input_tokens}", file=sys.stderr)
+            if message.usage.cache_read_input_tokens or message.usage.cache_creation_input_tokens:
+                print(
+                    f"Cached prompt tokens: {message.usage.cache_read_input_tokens or 0} read, "
+                    f"{message.usage.cache_creation_input_tokens or 0} written",
+                    file=sys.stderr,
+                )
             print(f"Output tokens: {message.usage.output_tokens}", file=sys.stderr)
 
             # Calculate approximate cost
@@ -633,11 +1203,9 @@ IMPORTANT FORMATTING GUIDELINES:
 
         # Extract text from response
         content = message.content[0].text if message.content else ""
+        self._write_cached_response(cache_path, content)
 
         if debug:
-            import sys
-            from pathlib import Path
-
             # Determine debug directory
             base_dir = debug_dir if debug_dir else Path.cwd()
 
@@ -670,77 +1238,26 @@ IMPORTANT FORMATTING GUIDELINES:
         Returns:
             Markdown formatted recipe
         """
+        # Keyed on the untrimmed content so cache hits skip token counting
+        cache_path = self._response_cache_path(
+            self._youtube_system_prompt,
+            {"url": url, "channel": metadata["channel"], "content": content, "max_input_tokens": self.max_input_tokens},
+        )
+        cached = self._read_cached_response(cache_path, verbose=verbose)
+        if cached is not None:
+            return cached
+
+        # The video title and channel lead the content, so trimming only cuts the description
+        content = self._trim_to_token_budget(content, verbose=verbose or debug)
         prompt = f"""Extract the recipe from the following YouTube video description and format it into a structured markdown format.
 
 Source: YouTube Video - {metadata['channel']}
 Video URL: {url}
 
 Content:
-{content}
-
-You MUST follow this exact template structure:
-
-{self.template}
-
-Instructions:
-- Extract ONLY recipe information from the description (ignore timestamps, social media links, promotional content, video timestamps)
-- YouTube descriptions often contain recipe info after intro text and before social links - focus on the recipe content
-- Fill in the template with the actual recipe information
-- Analyze the recipe and fill in the properties line with appropriate values:
-  * Cuisine: Choose from (Moroccan, Caribbean, Vietnamese, Turkish, Lebanese, Brazilian, Korean, Spanish, Thai, Indian, Southern, Greek, Mexican, French, American, Italian, Chinese)
-  * Protein: Choose from (Fish, Veg, Beef, Pork, Turkey, Chicken) - can be multiple separated by commas
-  * Course: Choose from (Dinner, Lunch, Breakfast, Sauce, Salad, Main Course, Soup, Dessert, Side, Appetizer, Beverage)
-  * Method: Choose from (Smoking, Baking, Blanching, Microwaving, Sautéing, Broiling, No-Cook, Marinating, Pickling, Braising, Steaming, Oven, Fry, Roast, Stove Top, Grill, BBQ, Crockpot) - can be multiple separated by commas
-  * Effort: Estimate effort level - use 🔪 for quick/easy recipes (under 1 hour), 🔪🔪 for medium effort (over 1 hour), 🔪🔪🔪 for high effort (multi-day, overnight, or long marinating)
-  * Rating: Leave blank (will be filled by user)
-  * Cook Time: Extract from description or estimate total cooking time in minutes
-- Use the exact section headers shown in the template including horizontal rules (---)
-- For Ingredients: Use a markdown table with three columns: Ingredient | Measurement | Method
-  * Ingredient column: ingredient name (e.g., "all-purpose flour", "butter", "onions")
-  * Measurement column: quantity and unit (e.g., "2 cups", "1 tablespoon", "3 ounces") - leave blank if no measurement
-  * IMPORTANT: Use US Customary units ONLY - do NOT include metric conversions (no grams, milliliters, etc.)
-  * Method column: preparation/state (e.g., "finely chopped", "melted", "room temperature") - leave blank if not applicable
-  * If the recipe has multiple sections (e.g., "For the dough", "For the filling"), use ### subheadings followed by separate tables
-- For Directions: Use numbered lists (1., 2., 3., etc.) with clear, actionable steps
-- If the recipe has distinct phases (e.g., "For the dough", "For the filling"), use ### subheadings to organize the directions
-- Add a blank line between each numbered direction step
-- For Links section: Include the YouTube video URL
-- For Photos, Notes sections: Only include the heading and horizontal rules. Add content ONLY if present in the description
-- For Nutrition section: Estimate macros per serving based on the ingredients and quantities. Calculate rough estimates for calories, protein, carbs, and fat
-- Be precise with ingredient amounts and direction details
-- If information is missing, omit that section entirely
-- Ensure measurements are clear and complete
-- Clean up any formatting issues from source
-- Do not add any text outside of this template structure
-- Include all sections: Ingredients, Directions, Notes, Links, Nutrition, and Photos with horizontal rules (---) between them
-
-CRITICAL - COMPLETENESS VERIFICATION:
-For Ingredients:
-1. First, locate and count ALL ingredients in the description's ingredients list
-2. Extract every single ingredient - do not skip any
-3. After extraction, verify your ingredient count matches the source
-4. If the description shows "X ingredients" or has a numbered/bulleted list, ensure you have exactly that many
-5. Double-check you haven't missed any ingredients, especially those at the end of lists
-
-For Directions:
-1. First, locate and count ALL direction steps in the description
-2. Extract every single step - do not skip any, especially not the final steps
-3. If the description has numbered directions, preserve the original numbering (don't renumber)
-4. After extraction, verify your step count matches the source
-5. Pay special attention to capture the LAST direction step - this is commonly missed
-6. Include all sub-steps and details from each direction
-
-IMPORTANT FORMATTING GUIDELINES:
-- Write out abbreviated units (e.g., "2 tbsp" → "2 tablespoon", "1 tsp" → "1 teaspoon")
-- Use ASCII fractions instead of unicode (e.g., "½" → "1/2", "¼" → "1/4")
-- Use explicit numbered steps for directions (1., 2., 3., etc.) with blank lines between steps
-- Pluralize units when quantity is greater than 1 (e.g., "2 tablespoons", "3 cups")
-- Always include horizontal rules (---) between sections"""
+{content}"""
 
         if debug:
-            import sys
-            from pathlib import Path
-
             # Determine debug directory
             base_dir = debug_dir if debug_dir else Path.cwd()
 
@@ -750,18 +1267,20 @@ IMPORTANT FORMATTING GUIDELINES:
                 f.write("="*80 + "\n")
                 f.write("DEBUG MODE - YOUTUBE EXTRACTION - PROMPT\n")
                 f.write("="*80 + "\n\n")
+                f.write(self._youtube_system_prompt)
+                f.write("\n\n" + "="*80 + "\n\n")
                 f.write(prompt)
                 f.write("\n\n" + "="*80 + "\n")
 
             print(f"Debug: Prompt (including YouTube video description) written to {debug_prompt_file}", file=sys.stderr)
 
-        import time
-
         start_time = time.time()
 
         message = self.client.messages.create(
             model=self.model,
             max_tokens=4000,
+            # Static template and instructions go in a cached system prompt so repeat calls reuse them
+            system=_cached_system_prompt(self._youtube_system_prompt),
             messages=[
                 {
                     "role": "user",
@@ -773,10 +1292,14 @@ IMPORTANT FORMATTING GUIDELINES:
         elapsed = time.time() - start_time
 
         if verbose:
-            import sys
-
             print(f"API call completed in {elapsed:.2f}s", file=sys.stderr)
             print(f"Input tokens: {message.usage.input_tokens}", file=sys.stderr)
+            if message.usage.cache_read_input_tokens or message.usage.cache_creation_input_tokens:
+                print(
+                    f"Cached prompt tokens: {message.usage.cache_read_input_tokens or 0} read, "
+                    f"{message.usage.cache_creation_input_tokens or 0} written",
+                    file=sys.stderr,
+                )
             print(f"Output tokens: {message.usage.output_tokens}", file=sys.stderr)
 
             # Calculate approximate cost
@@ -796,11 +1319,9 @@ IMPORTANT FORMATTING GUIDELINES:
 
         # Extract text from response
         content = message.content[0].text if message.content else ""
+        self._write_cached_response(cache_path, content)
 
         if debug:
-            import sys
-            from pathlib import Path
-
             # Determine debug directory
             base_dir = debug_dir if debug_dir else Path.cwd()
 
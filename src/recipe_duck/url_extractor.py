@@ -3,23 +3,70 @@
 Handles fetching web recipe pages for LLM processing, including YouTube videos.
 """
 
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
 import re
+import sys
+import tempfile
 import time
-from typing import Optional
-from urllib.parse import urlparse, parse_qs
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+logger = logging.getLogger(__name__)
+
+# Trailing page extension stripped from recipe slugs
+_PAGE_EXTENSION_RE = re.compile(r"\.(html|htm|php)$")
+
+# Cached pages younger than this (seconds) are reused without revalidating
+PAGE_CACHE_TTL = 3600
+
+# ytInitialData JSON object embedded in YouTube watch pages
+_YT_INITIAL_DATA_RE = re.compile(r"var ytInitialData = ({.*?});</script>", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=8)
+def _extract_text(html: str) -> str:
+    """Extract clean text from HTML, memoized so the same page is only parsed once.
+
+    Args:
+        html: HTML content to parse
+
+    Returns:
+        Cleaned text content
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    # Remove elements that are never useful for recipes
+    for element in soup(["script", "style", "nav", "header", "footer", "aside", "iframe", "noscript"]):
+        element.decompose()
+
+    # Try to find main content area to reduce noise
+    # This is just to reduce token usage, not for extraction accuracy
+    main_content = soup.find("main") or soup.find("article") or soup.find("body")
+
+    if main_content:
+        return main_content.get_text(separator="\n", strip=True)
+
+    return soup.get_text(separator="\n", strip=True)
+
 
 class URLRecipeExtractor:
     """Fetch and clean recipe webpages for LLM extraction."""
 
-    def __init__(self, anthropic_client=None):
+    def __init__(self, anthropic_client=None, cache_dir: Path | None = None):
         """Initialize the URL extractor with default headers.
 
         Args:
             anthropic_client: Optional Anthropic client for LLM-based print URL detection
+            cache_dir: Optional directory for caching fetched pages between runs
         """
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -27,10 +74,17 @@ class URLRecipeExtractor:
         }
         self.anthropic_client = anthropic_client
         self._print_url_cache: dict[str, str] = {}  # Cache successful patterns by domain
+        self.cache_dir = cache_dir
+        # One session per extractor keeps connections alive across the page fetch,
+        # print URL probes and later process_url calls to the same hosts
+        self.session = requests.Session()
 
     def fetch_page(self, url: str, timeout: int = 10) -> str:
         """Fetch HTML content from URL.
 
+        With a cache_dir, pages fetched within PAGE_CACHE_TTL are served from disk,
+        and older ones are revalidated with a conditional GET.
+
         Args:
             url: The URL to fetch
             timeout: Request timeout in seconds
@@ -41,10 +95,24 @@ class URLRecipeExtractor:
         Raises:
             Exception: If the URL cannot be fetched
         """
+        cached = self._read_page_cache(url)
+        headers = self.headers
+        if cached:
+            cached_html: str = cached["html"]
+            if time.time() - cached["fetched_at"] < PAGE_CACHE_TTL:
+                return cached_html
+            headers = dict(self.headers)
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         try:
-            response = requests.get(url, headers=self.headers, timeout=timeout)
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            if cached and response.status_code == 304:
+                self._write_page_cache(url, cached_html, cached.get("etag"), cached.get("last_modified"))
+                return cached_html
             response.raise_for_status()
-            return response.text
         except requests.Timeout:
             raise Exception(f"Website took too long to respond (timeout: {timeout}s)")
         except requests.HTTPError as e:
@@ -52,6 +120,82 @@ class URLRecipeExtractor:
         except requests.RequestException as e:
             raise Exception(f"Failed to fetch URL: {str(e)}")
 
+        html = response.text
+        self._write_page_cache(url, html, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return html
+
+    def _page_cache_path(self, url: str) -> Path | None:
+        """Get the cache file for a URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Path of the JSON cache entry inside cache_dir, or None when caching is disabled
+        """
+        if self.cache_dir is None:
+            return None
+
+        return self.cache_dir / f"{hashlib.blake2b(url.encode('utf-8'), digest_size=20).hexdigest()}.json"
+
+    def _read_page_cache(self, url: str) -> dict[str, Any] | None:
+        """Read a cached page.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Cache entry with html, etag, last_modified and fetched_at, or None on a
+            miss or when caching is disabled
+        """
+        cache_path = self._page_cache_path(url)
+        if cache_path is None:
+            return None
+
+        try:
+            entry: dict[str, Any] = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def _write_page_cache(self, url: str, html: str, etag: Any, last_modified: Any) -> None:
+        """Store a fetched page, replacing the entry atomically; no-op without a cache_dir.
+
+        Caching is best-effort: a cache directory that can't be written is
+        logged at debug level and otherwise ignored.
+
+        Args:
+            url: Page URL
+            html: Page HTML
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+        """
+        cache_path = self._page_cache_path(url)
+        if cache_path is None:
+            return
+
+        entry = {
+            "url": url,
+            "html": html,
+            "etag": etag if isinstance(etag, str) else None,
+            "last_modified": last_modified if isinstance(last_modified, str) else None,
+            "fetched_at": time.time(),
+        }
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per write, so threads storing the same page don't collide
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.debug("Could not write page cache %s: %s", cache_path, e)
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink(missing_ok=True)
+
     def extract_content(self, html: str) -> str:
         """Extract clean text content from HTML for LLM processing.
 
@@ -66,25 +210,12 @@ class URLRecipeExtractor:
             and navigation elements. The actual recipe extraction is handled by
             the LLM, which can understand recipe content regardless of HTML structure.
         """
-        soup = BeautifulSoup(html, "lxml")
-
-        # Remove elements that are never useful for recipes
-        for element in soup(["script", "style", "nav", "header", "footer", "aside", "iframe", "noscript"]):
-            element.decompose()
-
-        # Try to find main content area to reduce noise
-        # This is just to reduce token usage, not for extraction accuracy
-        main_content = soup.find("main") or soup.find("article") or soup.find("body")
-
-        if main_content:
-            return main_content.get_text(separator="\n", strip=True)
-
-        return soup.get_text(separator="\n", strip=True)
+        return _extract_text(html)
 
     def find_best_url(
         self,
         url: str,
-        detection_model: Optional[str] = None,
+        detection_model: str | None = None,
         timeout_budget: int = 15,
         verbose: bool = False,
     ) -> tuple[str, str]:
@@ -106,8 +237,6 @@ class URLRecipeExtractor:
             Tuple of (best_url, method_used) where method is one of:
             "cache", "pattern", "llm", "original"
         """
-        import sys
-
         start_time = time.time()
 
         if verbose:
@@ -195,7 +324,7 @@ class URLRecipeExtractor:
         parsed = urlparse(url)
         return parsed.netloc
 
-    def _extract_recipe_slug(self, url: str) -> Optional[str]:
+    def _extract_recipe_slug(self, url: str) -> str | None:
         """Extract recipe slug from URL for WordPress-style patterns.
 
         Args:
@@ -216,7 +345,7 @@ class URLRecipeExtractor:
             # Must be at least 3 chars and not all digits
             if len(part) >= 3 and not part.isdigit():
                 # Clean up trailing extensions
-                slug = re.sub(r"\.(html|htm|php)$", "", part)
+                slug = _PAGE_EXTENSION_RE.sub("", part)
                 return slug
 
         return None
@@ -334,7 +463,7 @@ class URLRecipeExtractor:
         for attempt in range(max_retries + 1):
             try:
                 # Try HEAD request first (faster)
-                response = requests.head(url, headers=self.headers, timeout=timeout, allow_redirects=True)
+                response = self.session.head(url, headers=self.headers, timeout=timeout, allow_redirects=True)
 
                 # Handle rate limiting with exponential backoff
                 if response.status_code in (429, 503) and attempt < max_retries:
@@ -348,7 +477,7 @@ class URLRecipeExtractor:
 
                     # If content-length not in headers, do a GET request
                     if content_length == 0:
-                        response = requests.get(url, headers=self.headers, timeout=timeout)
+                        response = self.session.get(url, headers=self.headers, timeout=timeout)
                         content_length = len(response.content)
 
                     # Validate reasonable size (>1KB, <5MB)
@@ -372,9 +501,9 @@ class URLRecipeExtractor:
     def _ask_llm_for_print_url(
         self,
         url: str,
-        model: Optional[str] = None,
+        model: str | None = None,
         verbose: bool = False,
-    ) -> Optional[str]:
+    ) -> str | None:
         """Use LLM to find print URL by analyzing page HTML.
 
         Args:
@@ -385,20 +514,22 @@ class URLRecipeExtractor:
         Returns:
             Print URL if found, None otherwise
         """
-        import sys
-
         if not self.anthropic_client:
             return None
 
         try:
             # Fetch first 10KB of HTML (usually enough to find print button)
-            response = requests.get(url, headers=self.headers, timeout=10, stream=True)
+            response = self.session.get(url, headers=self.headers, timeout=10, stream=True)
             html_snippet = ""
-            for chunk in response.iter_content(chunk_size=1024, decode_unicode=True):
-                if chunk:
-                    html_snippet += chunk
-                    if len(html_snippet) >= 10240:  # 10KB
-                        break
+            try:
+                for chunk in response.iter_content(chunk_size=1024, decode_unicode=True):
+                    if chunk:
+                        html_snippet += chunk
+                        if len(html_snippet) >= 10240:  # 10KB
+                            break
+            finally:
+                # Release the connection back to the pool despite the early break
+                response.close()
 
             prompt = f"""Analyze this HTML snippet from a recipe webpage and find the print button URL.
 
@@ -452,7 +583,7 @@ Print URL:"""
 class YouTubeRecipeExtractor:
     """Extract recipe information from YouTube video descriptions."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: str | None = None):
         """Initialize the YouTube extractor.
 
         Args:
@@ -483,7 +614,7 @@ class YouTubeRecipeExtractor:
         )
 
     @staticmethod
-    def extract_video_id(url: str) -> Optional[str]:
+    def extract_video_id(url: str) -> str | None:
         """Extract video ID from YouTube URL.
 
         Args:
@@ -544,8 +675,6 @@ class YouTubeRecipeExtractor:
         Raises:
             Exception: If video info cannot be fetched
         """
-        import sys
-
         video_id = self.extract_video_id(url)
         if not video_id:
             raise Exception(f"Could not extract video ID from URL: {url}")
@@ -595,8 +724,6 @@ class YouTubeRecipeExtractor:
                 "Install with: pip install google-api-python-client"
             )
 
-        import sys
-
         try:
             youtube = build("youtube", "v3", developerKey=self.api_key)
 
@@ -656,9 +783,6 @@ class YouTubeRecipeExtractor:
             This is a fallback method and may be fragile due to YouTube's
             dynamic page structure. API method is preferred.
         """
-        import sys
-        import json
-
         watch_url = f"https://www.youtube.com/watch?v={video_id}"
 
         try:
@@ -674,8 +798,7 @@ class YouTubeRecipeExtractor:
             channel = "Unknown Channel"
 
             # Try to find ytInitialData (contains video metadata)
-            pattern = r"var ytInitialData = ({.*?});</script>"
-            match = re.search(pattern, html, re.DOTALL)
+            match = _YT_INITIAL_DATA_RE.search(html)
 
             if match:
                 try:
@@ -92,6 +92,9 @@ resource "aws_lambda_function" "recipe_processor" {
   timeout          = var.lambda_timeout
   memory_size      = var.lambda_memory
 
+  # Parameters and Secrets Lambda Extension (layers only apply to ZIP deployments)
+  layers = var.lambda_image_uri == "" && var.secrets_extension_layer_arn != "" ? [var.secrets_extension_layer_arn] : null
+
   environment {
     variables = {
       ANTHROPIC_API_KEY_SECRET    = aws_secretsmanager_secret.anthropic_api_key.name
@@ -100,6 +103,7 @@ resource "aws_lambda_function" "recipe_processor" {
       EMAIL_WHITELIST_SECRET      = aws_secretsmanager_secret.email_whitelist.name
       ANTHROPIC_MODEL            = var.anthropic_model
       DELETE_EMAILS_AFTER_PROCESSING = tostring(var.delete_emails_after_processing)
+      SECRETS_MANAGER_TTL        = tostring(var.secrets_extension_ttl)
     }
   }
 
@@ -85,3 +85,15 @@ variable "lambda_image_uri" {
   type        = string
   default     = ""
 }
+
+variable "secrets_extension_layer_arn" {
+  description = "ARN of the AWS-Parameters-and-Secrets-Lambda-Extension layer for your region (ZIP deployments only)"
+  type        = string
+  default     = ""
+}
+
+variable "secrets_extension_ttl" {
+  description = "Seconds the secrets extension caches secret values across invocations"
+  type        = number
+  default     = 300
+}
@@ -124,7 +124,7 @@ def test_filename_generation_from_url():
     assert generate_filename_from_url("https://example.com/recipe/test-recipe-name") == "test_recipe_name"
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_process_url_with_structured_data(mock_get, api_key, sample_recipe_html):
     """Test processing URL with structured data (mocked network call)."""
     # Mock the HTTP request
@@ -149,7 +149,7 @@ def test_process_url_with_structured_data(mock_get, api_key, sample_recipe_html)
     assert "## Instructions" in markdown or "Instructions" in markdown
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_cli_with_url(mock_get, api_key, temp_output_dir, sample_recipe_html):
     """Test CLI with URL input (mocked network call)."""
     # Mock the HTTP request
@@ -189,7 +189,7 @@ def test_cli_with_url(mock_get, api_key, temp_output_dir, sample_recipe_html):
     assert "# " in content  # Should have a title
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_cli_url_default_output_filename(mock_get, api_key, temp_output_dir, sample_recipe_html):
     """Test that CLI generates appropriate filename for URL input."""
     # Mock the HTTP request
@@ -231,7 +231,7 @@ def test_cli_url_default_output_filename(mock_get, api_key, temp_output_dir, sam
         os.chdir(original_dir)
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_url_with_verbose_flag(mock_get, api_key, temp_output_dir, sample_recipe_html):
     """Test verbose output for URL processing."""
     # Mock the HTTP request
@@ -268,7 +268,7 @@ def test_url_with_verbose_flag(mock_get, api_key, temp_output_dir, sample_recipe
     assert "url" in stderr or "fetch" in stderr or "processing" in stderr
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_url_with_formatting_disabled(mock_get, api_key, temp_output_dir, sample_recipe_html):
     """Test URL processing with formatting disabled."""
     # Mock the HTTP request
@@ -308,7 +308,7 @@ def test_url_error_handling_invalid_url(api_key):
         processor.process_url("https://this-is-a-fake-url-that-does-not-exist-12345.com/recipe")
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_url_error_handling_timeout(mock_get, api_key):
     """Test handling of timeout errors."""
     import requests
@@ -321,7 +321,7 @@ def test_url_error_handling_timeout(mock_get, api_key):
         processor.process_url(TEST_URL)
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_process_url_without_structured_data(mock_get, api_key):
     """Test processing URL without JSON-LD (fallback to HTML parsing)."""
     # HTML without JSON-LD
@@ -57,6 +57,12 @@ class TestFractionNormalization(TestRecipeFormatter):
         result = formatter._normalize_fractions(text)
         assert result == text
 
+    def test_custom_fractions_only(self, custom_formatter):
+        """Test that only fractions from a custom config are normalized."""
+        text = "Use ½ cup, ⅓ cup, and 0.5 tsp"
+        result = custom_formatter._normalize_fractions(text)
+        assert result == "Use 1/2 cup, ⅓ cup, and 0.5 tsp"
+
 
 class TestUnitNormalization(TestRecipeFormatter):
     """Test unit normalization."""
@@ -148,6 +154,12 @@ class TestIngredientFormatting(TestRecipeFormatter):
         assert result.startswith("- ")
         assert "*" not in result
 
+    def test_convert_plus_to_dash(self, formatter):
+        """Test converting plus bullets to dashes."""
+        line = "+ 2 cups flour"
+        result = formatter._format_ingredient_line(line)
+        assert result == "- 2 cups flour"
+
     def test_combined_formatting(self, formatter):
         """Test ingredient with fractions, units, and bullets."""
         line = "½ tbsp vanilla extract"
@@ -174,6 +186,12 @@ class TestInstructionFormatting(TestRecipeFormatter):
         assert not result.startswith("-")
         assert "Preheat oven" in result
 
+    def test_remove_plus_bullet_from_instruction(self, formatter):
+        """Test removing plus bullets from instructions."""
+        line = "+ Preheat oven to 350°F"
+        result = formatter._format_instruction_line(line)
+        assert result == "Preheat oven to 350°F"
+
 
 class TestFullRecipeFormatting(TestRecipeFormatter):
     """Test formatting complete recipe markdown."""
@@ -224,6 +242,31 @@ Mix ingredients
         assert "3. Bake for 10 minutes" in result
         assert "4. Cool and serve" in result
 
+    def test_format_and_renumber_matches_two_passes(self, formatter):
+        """Test the single-pass method matches format() followed by renumbering."""
+        recipe = """# Recipe
+
+## Ingredients
+
+½ tbsp butter
+* 1 cup flour
+
+## Instructions
+
+- Preheat oven
+3. Mix ingredients
+
+Bake for 10 minutes
+
+---
+
+## Notes
+Keep cool
+"""
+        expected = formatter.renumber_instructions(formatter.format(recipe))
+        assert formatter.format_and_renumber(recipe) == expected
+        assert "2. Mix ingredients" in expected
+
     def test_preserve_section_headers(self, formatter):
         """Test that section headers are preserved."""
         recipe = """# Recipe Title
@@ -1,9 +1,23 @@
 """Tests for Notion client functionality."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import pytest
+from unittest.mock import MagicMock, patch
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
 from recipe_duck.notion_client import NotionRecipeClient
 
 
+def make_http_error(status, headers=None):
+    """Build a Notion HTTP error with the given status, independent of SDK version."""
+    error = HTTPResponseError.__new__(HTTPResponseError)
+    error.status = status
+    error.headers = httpx.Headers(headers or {})
+    return error
+
+
 class TestNotionRecipeClient:
     """Tests for NotionRecipeClient class."""
 
@@ -253,3 +267,223 @@ Both methods work great!
         assert result["cook_time"] == ""
         assert result["total_time"] == ""
         assert result["servings"] == ""
+
+    def test_parse_known_heading_with_extra_spaces_ends_section(self):
+        """Test that a loosely spaced known heading starts a new section."""
+        markdown = """# Soup
+
+## Directions
+
+1. Simmer
+
+##  Notes  
+
+Serve hot
+"""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        result = client.parse_recipe_markdown(markdown)
+
+        assert result["directions"] == "1. Simmer"
+        assert result["notes"] == "Serve hot"
+
+    def test_parse_title_requires_text_on_heading_line(self):
+        """Test that a bare "#" line doesn't take the next line as the recipe name."""
+        markdown = """#
+Soup
+
+## Ingredients
+
+- Salt
+"""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        result = client.parse_recipe_markdown(markdown)
+
+        assert result["name"] == "Untitled Recipe"
+        assert result["ingredients"] == "- Salt"
+
+    def test_create_page_appends_blocks_beyond_limit(self):
+        """Test that blocks past the per-request limit are appended in order."""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.pages.create.return_value = {"id": "page-id", "url": "https://notion.so/page"}
+        blocks = [{"type": "paragraph", "index": i} for i in range(250)]
+
+        url = client._create_page({}, blocks)
+
+        assert url == "https://notion.so/page"
+        assert client.client.pages.create.call_args.kwargs["children"] == blocks[:100]
+        appended = [call.kwargs["children"] for call in client.client.blocks.children.append.call_args_list]
+        assert appended == [blocks[100:200], blocks[200:]]
+
+    def test_long_ingredient_table_is_split(self):
+        """Test that ingredient tables beyond the children limit are split into several tables."""
+        rows = "\n".join(f"| item {i} | 1 cup | chopped |" for i in range(150))
+        markdown = f"""# Big Recipe
+
+## Ingredients
+
+| Ingredient | Measurement | Method |
+|---|---|---|
+{rows}
+"""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        blocks = client._build_page_content(client.parse_recipe_markdown(markdown))
+
+        tables = [b["table"]["children"] for b in blocks if b["type"] == "table"]
+        assert [len(children) for children in tables] == [100, 52]
+        assert tables[1][1]["table_row"]["cells"][0][0]["text"]["content"] == "item 99"
+
+    @patch("recipe_duck.notion_client.time.sleep")
+    def test_create_page_retries_rate_limit(self, mock_sleep):
+        """Test that rate-limited requests are retried after the Retry-After delay."""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.pages.create.side_effect = [
+            make_http_error(429, {"retry-after": "2"}),
+            {"id": "page-id", "url": "https://notion.so/page"},
+        ]
+
+        assert client._create_page({}, []) == "https://notion.so/page"
+        assert client.client.pages.create.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("recipe_duck.notion_client.time.sleep")
+    def test_create_page_does_not_retry_client_errors(self, mock_sleep):
+        """Test that non-transient errors are raised without retrying."""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.pages.create.side_effect = make_http_error(400)
+
+        with pytest.raises(HTTPResponseError):
+            client._create_page({}, [])
+        assert client.client.pages.create.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("recipe_duck.notion_client.time.sleep")
+    def test_create_page_does_not_retry_ambiguous_server_errors(self, mock_sleep):
+        """Test that a create is not retried on errors that may follow a successful write."""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.pages.create.side_effect = make_http_error(502)
+
+        with pytest.raises(HTTPResponseError):
+            client._create_page({}, [])
+        assert client.client.pages.create.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("recipe_duck.notion_client.time.sleep")
+    def test_schema_retrieve_retries_server_errors(self, mock_sleep):
+        """Test that idempotent reads are retried on transient server errors."""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.databases.retrieve.side_effect = [make_http_error(504), {"properties": {"Name": {}}}]
+
+        assert client._get_property_names() == frozenset({"Name"})
+        assert client.client.databases.retrieve.call_count == 2
+
+    def test_push_recipe_skips_properties_missing_from_schema(self):
+        """Test that properties the database lacks are dropped before creating the page."""
+        markdown = """# Soup
+
+*Cuisine: Thai | Protein: Chicken | Course: Dinner | Method: Stove Top | Effort: 🔪 | Rating: 5 | Cook Time: 30 min*
+"""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.databases.retrieve.return_value = {"properties": {"Name": {}, "Cuisine": {}}}
+        client.client.pages.create.return_value = {"id": "page-id", "url": "https://notion.so/page"}
+
+        client.push_recipe(markdown)
+        client.push_recipe(markdown)
+
+        properties = client.client.pages.create.call_args.kwargs["properties"]
+        assert set(properties) == {"Name", "Cuisine"}
+        assert client.client.databases.retrieve.call_count == 1
+        assert client.client.pages.create.call_count == 2
+
+    def test_concurrent_push_recipe_waits_for_schema(self):
+        """Test that pushes racing the first schema fetch still filter properties."""
+        markdown = """# Soup
+
+*Cuisine: Thai | Protein: Chicken | Course: Dinner | Method: Stove Top | Effort: 🔪 | Rating: 5 | Cook Time: 30 min*
+"""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+
+        def slow_retrieve(**kwargs):
+            time.sleep(0.05)  # widen the window for racing pushes
+            return {"properties": {"Name": {}, "Cuisine": {}}}
+
+        client.client.databases.retrieve.side_effect = slow_retrieve
+        client.client.pages.create.return_value = {"id": "page-id", "url": "https://notion.so/page"}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: client.push_recipe(markdown), range(4)))
+
+        assert client.client.databases.retrieve.call_count == 1
+        for call in client.client.pages.create.call_args_list:
+            assert set(call.kwargs["properties"]) == {"Name", "Cuisine"}
+
+    def test_push_recipe_reads_schema_from_data_source(self):
+        """Test that the schema comes from the data source when the database has no properties."""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.databases.retrieve.return_value = {"data_sources": [{"id": "ds-id", "name": "Recipes"}]}
+        client.client.data_sources.retrieve.return_value = {"properties": {"Name": {}, "Cuisine": {}}}
+
+        assert client._get_property_names() == frozenset({"Name", "Cuisine"})
+        client.client.data_sources.retrieve.assert_called_once_with(data_source_id="ds-id")
+
+    def test_push_recipe_creates_page_when_schema_retrieve_times_out(self):
+        """Test that a failed schema fetch disables filtering instead of aborting the push."""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.databases.retrieve.side_effect = RequestTimeoutError()
+        client.client.pages.create.return_value = {"id": "page-id", "url": "https://notion.so/page"}
+
+        markdown = """# Soup
+
+*Cuisine: Thai | Protein: Chicken | Course: Dinner | Method: Stove Top | Effort: 🔪 | Rating: 5 | Cook Time: 30 min*
+"""
+        assert client.push_recipe(markdown) == "https://notion.so/page"
+        assert "Cuisine" in client.client.pages.create.call_args.kwargs["properties"]
+
+    def test_push_recipe_retries_without_missing_property(self):
+        """Test that a missing-property error retries the create with only the Name property."""
+        markdown = """# Soup
+
+*Cuisine: Thai | Protein: Chicken | Course: Dinner | Method: Stove Top | Effort: 🔪 | Rating: 5 | Cook Time: 30 min*
+"""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.databases.retrieve.return_value = {}
+        client.client.pages.create.side_effect = [
+            ValueError("body failed validation.\nCook Time is not a property that exists."),
+            {"id": "page-id", "url": "https://notion.so/page"},
+        ]
+
+        assert client.push_recipe(markdown) == "https://notion.so/page"
+        assert set(client.client.pages.create.call_args.kwargs["properties"]) == {"Name"}
+
+    def test_push_recipes_returns_urls_in_input_order(self):
+        """Test that concurrent pushes return page URLs matching the input order."""
+        client = NotionRecipeClient(api_key="fake_key", database_id="fake_db_id")
+        client.client = MagicMock()
+        client.client.databases.retrieve.return_value = {"properties": {"Name": {}}}
+        client.client.pages.create.side_effect = lambda **kwargs: {
+            "id": "page-id",
+            "url": f"https://notion.so/{kwargs['properties']['Name']['title'][0]['text']['content']}",
+        }
+
+        urls = client.push_recipes([f"# Recipe {i}\n" for i in range(5)])
+
+        assert urls == [f"https://notion.so/Recipe {i}" for i in range(5)]
+        assert client.client.databases.retrieve.call_count == 1
+
+    def test_clients_with_same_key_share_connection_pool(self):
+        """Test that default HTTP clients are shared per API key."""
+        first = NotionRecipeClient(api_key="fake_key", database_id="db_one")
+        second = NotionRecipeClient(api_key="fake_key", database_id="db_two")
+        other = NotionRecipeClient(api_key="other_key", database_id="db_one")
+
+        assert first.client.client is second.client.client
+        assert first.client.client is not other.client.client
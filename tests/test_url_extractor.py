@@ -121,7 +121,7 @@ class TestURLRecipeExtractor:
         result = extractor._apply_pattern(url_with_query, "query_print")
         assert result == "https://example.com/recipe?id=123&print"
 
-    @patch('recipe_duck.url_extractor.requests.head')
+    @patch('recipe_duck.url_extractor.requests.Session.head')
     def test_validate_print_url_success(self, mock_head):
         """Test successful URL validation."""
         extractor = URLRecipeExtractor()
@@ -138,8 +138,8 @@ class TestURLRecipeExtractor:
         assert content_len == 50000
         mock_head.assert_called_once()
 
-    @patch('recipe_duck.url_extractor.requests.get')
-    @patch('recipe_duck.url_extractor.requests.head')
+    @patch('recipe_duck.url_extractor.requests.Session.get')
+    @patch('recipe_duck.url_extractor.requests.Session.head')
     def test_validate_print_url_no_content_length(self, mock_head, mock_get):
         """Test URL validation when content-length header is missing."""
         extractor = URLRecipeExtractor()
@@ -162,7 +162,7 @@ class TestURLRecipeExtractor:
         mock_head.assert_called_once()
         mock_get.assert_called_once()
 
-    @patch('recipe_duck.url_extractor.requests.head')
+    @patch('recipe_duck.url_extractor.requests.Session.head')
     def test_validate_print_url_too_small(self, mock_head):
         """Test URL validation with content too small."""
         extractor = URLRecipeExtractor()
@@ -178,7 +178,7 @@ class TestURLRecipeExtractor:
         assert is_valid is False
         assert content_len == 0
 
-    @patch('recipe_duck.url_extractor.requests.head')
+    @patch('recipe_duck.url_extractor.requests.Session.head')
     def test_validate_print_url_404(self, mock_head):
         """Test URL validation with 404 response."""
         extractor = URLRecipeExtractor()
@@ -194,7 +194,7 @@ class TestURLRecipeExtractor:
         assert content_len == 0
 
     @patch('recipe_duck.url_extractor.time.sleep')
-    @patch('recipe_duck.url_extractor.requests.head')
+    @patch('recipe_duck.url_extractor.requests.Session.head')
     def test_validate_print_url_retry_on_timeout(self, mock_head, mock_sleep):
         """Test retry logic on timeout."""
         extractor = URLRecipeExtractor()
@@ -214,7 +214,7 @@ class TestURLRecipeExtractor:
         mock_sleep.assert_called_once_with(1)  # Should sleep before retry
 
     @patch('recipe_duck.url_extractor.time.sleep')
-    @patch('recipe_duck.url_extractor.requests.head')
+    @patch('recipe_duck.url_extractor.requests.Session.head')
     def test_validate_print_url_retry_on_rate_limit(self, mock_head, mock_sleep):
         """Test retry logic on rate limiting."""
         extractor = URLRecipeExtractor()
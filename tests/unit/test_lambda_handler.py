@@ -0,0 +1,48 @@
+"""Unit tests for the Lambda handler."""
+
+import importlib.util
+import time
+import urllib.error
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+HANDLER_PATH = Path(__file__).parents[2] / "lambda" / "lambda_handler.py"
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    """Load a fresh copy of the Lambda handler module."""
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    spec = importlib.util.spec_from_file_location("lambda_handler", HANDLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_get_secrets_without_extension_creates_one_sdk_client(handler, monkeypatch):
+    """Test that concurrent SDK fallbacks share a single Secrets Manager client."""
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "token")
+    secrets_client = MagicMock()
+    secrets_client.get_secret_value.side_effect = lambda SecretId: {
+        "SecretString": f"value-{SecretId}"
+    }
+    created = []
+
+    def slow_client(service_name):
+        created.append(service_name)
+        time.sleep(0.05)  # widen the window for racing workers
+        return secrets_client
+
+    with (
+        patch.object(
+            handler.urllib.request, "urlopen", side_effect=urllib.error.URLError("refused")
+        ),
+        patch.object(handler.boto3, "client", side_effect=slow_client),
+    ):
+        values = handler.get_secrets("one", "two", "three", "four")
+
+    assert values == ["value-one", "value-two", "value-three", "value-four"]
+    assert created == ["secretsmanager"]
+    assert secrets_client.get_secret_value.call_count == 4
@@ -0,0 +1,387 @@
+"""Unit tests for RecipeProcessor."""
+
+import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pytest
+from anthropic.types import TextBlock, ThinkingBlock
+from PIL import Image
+
+from recipe_duck import processor as processor_module
+from recipe_duck.processor import (
+    RESIZE_MAX_DIMENSION,
+    RESIZE_MAX_PIXELS,
+    TOKEN_TRIM_MAX_ROUNDS,
+    RecipeProcessor,
+    downscale_image,
+    is_image_url,
+)
+
+
+def make_message(text):
+    """Build a mock Messages API response containing one text block."""
+    message = MagicMock()
+    message.content = [TextBlock(type="text", text=text)]
+    return message
+
+
+@pytest.fixture
+def processor():
+    """Create a processor with a mocked Anthropic client and a 1000 token budget."""
+    processor = RecipeProcessor(api_key="test-key", max_input_tokens=1000)
+    processor.client = MagicMock()
+    return processor
+
+
+def count_tokens_at(chars_per_token):
+    """Fake messages.count_tokens for text with a fixed chars-per-token ratio."""
+
+    def count_tokens(model, messages):
+        return MagicMock(input_tokens=len(messages[0]["content"]) // chars_per_token)
+
+    return count_tokens
+
+
+def test_trim_short_text_skips_token_counting(processor):
+    """Test that text that must fit the budget is sent without counting."""
+    text = "a" * 2000
+
+    assert processor._trim_to_token_budget(text) == text
+    processor.client.messages.count_tokens.assert_not_called()
+
+
+def test_trim_text_under_budget_is_unchanged(processor):
+    """Test that text counted under budget is returned whole after one count."""
+    processor.client.messages.count_tokens.side_effect = count_tokens_at(4)
+    text = "a" * 3500
+
+    assert processor._trim_to_token_budget(text) == text
+    assert processor.client.messages.count_tokens.call_count == 1
+
+
+def test_trim_text_over_budget(processor, capsys):
+    """Test that over-budget text is cut to fit after a character pre-cut."""
+    processor.client.messages.count_tokens.side_effect = count_tokens_at(2)
+
+    trimmed = processor._trim_to_token_budget("a" * 50_000, verbose=True)
+
+    assert len(trimmed) // 2 <= 1000
+    # Counted once after the character pre-cut and once after the proportional cut
+    assert processor.client.messages.count_tokens.call_count == 2
+    first_count = processor.client.messages.count_tokens.call_args_list[0]
+    assert len(first_count.kwargs["messages"][0]["content"]) == 4000
+    assert capsys.readouterr().err.count("WARNING") == 1
+
+
+def test_trim_reports_budget_still_exceeded_after_max_rounds(processor, capsys):
+    """Test that running out of recounts is reported instead of passing silently."""
+    processor.client.messages.count_tokens.return_value = MagicMock(input_tokens=5000)
+
+    processor._trim_to_token_budget("a" * 10_000, verbose=True)
+
+    assert processor.client.messages.count_tokens.call_count == TOKEN_TRIM_MAX_ROUNDS + 1
+    err = capsys.readouterr().err
+    assert err.count("WARNING") == 1
+    assert "still over the 1000 token budget" in err
+
+
+def test_cached_url_response_skips_token_counting(processor, tmp_path):
+    """Test that a cache hit returns before any token counting or model call."""
+    processor.cache_dir = tmp_path
+    processor.client.messages.count_tokens.side_effect = count_tokens_at(4)
+    processor.client.messages.create.return_value = make_message("# Soup")
+    content = "a" * 3500
+
+    assert processor._extract_recipe_from_url(content, "https://example.com/soup") == "# Soup"
+    processor.client.reset_mock()
+
+    assert processor._extract_recipe_from_url(content, "https://example.com/soup") == "# Soup"
+    processor.client.messages.count_tokens.assert_not_called()
+    processor.client.messages.create.assert_not_called()
+
+
+def test_process_many_matches_process_batch(processor, monkeypatch):
+    """Test that the asyncio entry point keeps process_batch's ordering and errors."""
+
+    def process(input_path, **kwargs):
+        if input_path == "bad.jpg":
+            raise ValueError("unreadable image")
+        return f"# {input_path}"
+
+    monkeypatch.setattr(processor, "process", process)
+    input_paths = [f"recipe{index}.jpg" for index in range(5)]
+
+    expected = processor.process_batch(input_paths, concurrency=2)
+    assert asyncio.run(processor.process_many(input_paths, concurrency=2)) == expected
+    with pytest.raises(ValueError, match="unreadable image"):
+        asyncio.run(processor.process_many(["recipe0.jpg", "bad.jpg"]))
+
+
+def make_batch(status):
+    """Build a mock message batch with the given processing status."""
+    batch = MagicMock(id="batch-id", processing_status=status)
+    batch.request_counts.processing = 0 if status == "ended" else 2
+    return batch
+
+
+def make_batch_result(custom_id, result_type, message=None):
+    """Build a mock entry from the batch results stream."""
+    entry = MagicMock(custom_id=custom_id)
+    entry.result.type = result_type
+    entry.result.message = message
+    return entry
+
+
+def test_process_images_with_batch_api(processor, tmp_path):
+    """Test submitting, polling and collecting a batch, including failed requests."""
+    image_paths = []
+    for name in ("soup.jpg", "cake.png", "stew.jpg"):
+        path = tmp_path / name
+        path.write_bytes(b"image-bytes")
+        image_paths.append(path)
+
+    succeeded = make_message("# Cake")
+    succeeded.content.insert(
+        0, ThinkingBlock(type="thinking", thinking="Reading...", signature="sig")
+    )
+    batches = processor.client.messages.batches
+    batches.create.return_value = make_batch("in_progress")
+    batches.retrieve.return_value = make_batch("ended")
+    # Results stream in completion order, not input order
+    batches.results.return_value = [
+        make_batch_result("2", "expired"),
+        make_batch_result("1", "succeeded", succeeded),
+        make_batch_result("0", "errored"),
+    ]
+
+    results = processor.process_images_with_batch_api(image_paths, poll_interval=0)
+
+    assert results == [None, "# Cake", None]
+    requests = batches.create.call_args.kwargs["requests"]
+    assert [request["custom_id"] for request in requests] == ["0", "1", "2"]
+    image = requests[1]["params"]["messages"][0]["content"][0]
+    assert image["source"]["media_type"] == "image/png"
+    batches.retrieve.assert_called_once_with("batch-id")
+    batches.results.assert_called_once_with("batch-id")
+
+
+def test_process_images_with_batch_api_empty(processor):
+    """Test that no images submits no batch."""
+    assert processor.process_images_with_batch_api([]) == []
+    processor.client.messages.batches.create.assert_not_called()
+
+
+def test_process_images_with_batch_api_splits_large_backlogs(processor, tmp_path, monkeypatch):
+    """Test that images are submitted in bounded batches with input-order results."""
+    monkeypatch.setattr(processor_module, "BATCH_MAX_IMAGES", 2)
+    image_paths = []
+    for index in range(5):
+        path = tmp_path / f"recipe{index}.jpg"
+        path.write_bytes(b"image-bytes")
+        image_paths.append(path)
+
+    submitted = {}
+
+    def create(requests):
+        batch = MagicMock(id=f"batch-{len(submitted)}", processing_status="ended")
+        submitted[batch.id] = [request["custom_id"] for request in requests]
+        return batch
+
+    batches = processor.client.messages.batches
+    batches.create.side_effect = create
+    batches.results.side_effect = lambda batch_id: [
+        make_batch_result(custom_id, "succeeded", make_message(f"# Recipe {custom_id}"))
+        for custom_id in submitted[batch_id]
+    ]
+
+    results = processor.process_images_with_batch_api(image_paths, poll_interval=0)
+
+    assert list(submitted.values()) == [["0", "1"], ["2", "3"], ["4"]]
+    assert results == [f"# Recipe {index}" for index in range(5)]
+
+
+def make_image(size, mode="RGB", image_format="PNG"):
+    """Encode a solid-colour image generated with Pillow."""
+    buffer = BytesIO()
+    Image.new(mode, size).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def resize_everything(monkeypatch):
+    """Drop the size threshold so small generated images are always resized."""
+    monkeypatch.setattr(processor_module, "RESIZE_MIN_BYTES", 0)
+
+
+def test_downscale_small_image_passes_through():
+    """Test that images under the size threshold are returned unchanged."""
+    image_bytes = make_image((3000, 2000))
+
+    assert downscale_image(image_bytes, ".PNG") == (image_bytes, ".png")
+
+
+def test_downscale_oversized_image(resize_everything):
+    """Test that oversized images fit both the edge and the pixel budget."""
+    image_bytes, suffix = downscale_image(make_image((4000, 1000)), ".png")
+
+    with Image.open(BytesIO(image_bytes)) as img:
+        width, height = img.size
+    assert max(width, height) <= RESIZE_MAX_DIMENSION
+    assert width * height <= RESIZE_MAX_PIXELS
+    assert suffix == ".jpg"
+
+    image_bytes, _ = downscale_image(make_image((1500, 1500)), ".png")
+
+    with Image.open(BytesIO(image_bytes)) as img:
+        width, height = img.size
+    assert max(width, height) <= RESIZE_MAX_DIMENSION
+    assert width * height <= RESIZE_MAX_PIXELS
+
+
+def test_downscale_transparent_image_stays_png(resize_everything):
+    """Test that images with an alpha channel are re-encoded as PNG."""
+    image_bytes, suffix = downscale_image(make_image((200, 100), mode="RGBA"), ".png")
+
+    assert suffix == ".png"
+    with Image.open(BytesIO(image_bytes)) as img:
+        assert img.format == "PNG"
+        assert img.mode == "RGBA"
+        assert img.size == (200, 100)
+
+
+def test_downscale_opaque_image_becomes_jpeg(resize_everything):
+    """Test that opaque images are re-encoded as JPEG."""
+    image_bytes, suffix = downscale_image(make_image((200, 100)), ".png")
+
+    assert suffix == ".jpg"
+    with Image.open(BytesIO(image_bytes)) as img:
+        assert img.format == "JPEG"
+
+
+def test_encode_image_without_resizing(resize_everything, tmp_path):
+    """Test that resize_images=False sends the original file bytes."""
+    image_bytes = make_image((3000, 2000))
+    image_path = tmp_path / "recipe.png"
+    image_path.write_bytes(image_bytes)
+
+    processor = RecipeProcessor(api_key="test-key", resize_images=False)
+    source = processor._encode_image(image_path)["source"]
+
+    assert source["media_type"] == "image/png"
+    assert base64.b64decode(source["data"]) == image_bytes
+
+
+IMAGE_DATA = {"type": "image", "source": {"type": "url", "url": "https://example.com/soup.jpg"}}
+
+
+@pytest.fixture
+def cached_processor(processor, tmp_path):
+    """Create a mocked processor that caches model responses under tmp_path."""
+    processor.cache_dir = tmp_path
+    processor.client.messages.create.return_value = make_message("# Soup")
+    return processor
+
+
+def test_response_cache_hit_skips_model_call(cached_processor):
+    """Test that a repeated request is answered from the cache."""
+    assert cached_processor._extract_recipe(IMAGE_DATA) == "# Soup"
+    assert cached_processor._extract_recipe(IMAGE_DATA) == "# Soup"
+
+    cached_processor.client.messages.create.assert_called_once()
+
+
+def test_response_cache_misses_on_model_change(cached_processor):
+    """Test that switching models doesn't reuse another model's response."""
+    cached_processor._extract_recipe(IMAGE_DATA)
+    cached_processor.model = "claude-opus-4-1"
+    cached_processor._extract_recipe(IMAGE_DATA)
+
+    assert cached_processor.client.messages.create.call_count == 2
+
+
+def test_response_cache_misses_on_prompt_change(cached_processor):
+    """Test that a changed prompt, e.g. from a new template, isn't served stale output."""
+    cached_processor._extract_recipe(IMAGE_DATA)
+    cached_processor._image_prompt += "\nAlso list the equipment."
+    cached_processor._extract_recipe(IMAGE_DATA)
+
+    assert cached_processor.client.messages.create.call_count == 2
+
+
+@pytest.mark.parametrize("corrupt", [b"", b"\xff\xfe not utf-8"])
+def test_response_cache_corrupt_entry_is_a_miss(cached_processor, corrupt):
+    """Test that empty or undecodable cache entries are refetched and replaced."""
+    cache_path = cached_processor._response_cache_path(
+        cached_processor._image_prompt, IMAGE_DATA["source"]
+    )
+    cache_path.write_bytes(corrupt)
+
+    assert cached_processor._extract_recipe(IMAGE_DATA) == "# Soup"
+    cached_processor.client.messages.create.assert_called_once()
+    assert cache_path.read_text(encoding="utf-8") == "# Soup"
+
+
+def test_response_cache_concurrent_writes_of_one_key(cached_processor):
+    """Test that threads storing the same response don't race on a shared temp file."""
+    cache_path = cached_processor._response_cache_path("prompt", IMAGE_DATA["source"])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda i: cached_processor._write_cached_response(cache_path, f"# Soup {i}"),
+                range(32),
+            )
+        )
+
+    assert cache_path.read_text(encoding="utf-8").startswith("# Soup")
+    assert [path.name for path in cache_path.parent.iterdir()] == [cache_path.name]
+
+
+def test_response_cache_write_failure_is_not_fatal(cached_processor, tmp_path):
+    """Test that an unwritable cache directory doesn't fail a paid request."""
+    cached_processor.cache_dir = tmp_path / "not-a-directory"
+    cached_processor.cache_dir.write_text("")
+
+    assert cached_processor._extract_recipe(IMAGE_DATA) == "# Soup"
+    cached_processor.client.messages.create.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://example.com/recipes/soup.jpg", True),
+        ("https://example.com/recipes/SOUP.PNG", True),
+        ("https://cdn.example.com/soup.webp?width=800&format=auto", True),
+        ("https://example.com/soup.jpeg#top", True),
+        ("https://example.com/recipes/soup", False),
+        ("https://example.com/recipes/soup.html", False),
+        ("https://example.com/render?file=soup.jpg", False),
+    ],
+)
+def test_is_image_url(url, expected):
+    """Test image detection from the URL path, ignoring query strings and case."""
+    assert is_image_url(url) is expected
+
+
+def test_process_image_url_references_image_by_url(processor):
+    """Test that image URLs are sent to the API as URL sources, not downloaded."""
+    processor.client.messages.create.return_value = make_message("# Soup\n\n## Ingredients\n")
+    url = "https://example.com/soup.jpg?size=large"
+
+    processor.process_image_url(url)
+
+    messages = processor.client.messages.create.call_args.kwargs["messages"]
+    assert messages == [
+        {"role": "user", "content": [{"type": "image", "source": {"type": "url", "url": url}}]}
+    ]
+
+
+def test_process_url_wraps_image_url_errors(processor):
+    """Test that a failing image URL raises the same error as a failing page URL."""
+    processor.client.messages.create.side_effect = RuntimeError("Could not fetch image")
+
+    with pytest.raises(Exception, match="Failed to process recipe from URL: Could not fetch image"):
+        processor.process_url("https://example.com/soup.jpg")
@@ -1,5 +1,7 @@
 """Unit tests for URL recipe extractor."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -152,7 +154,7 @@ def test_extract_content_fallback_to_body(extractor):
     assert "This should be extracted" in content
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_fetch_page_success(mock_get, extractor):
     """Test successful page fetching."""
     mock_response = Mock()
@@ -166,7 +168,7 @@ def test_fetch_page_success(mock_get, extractor):
     mock_get.assert_called_once()
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_fetch_page_timeout(mock_get, extractor):
     """Test handling of timeout errors."""
     import requests
@@ -177,7 +179,7 @@ def test_fetch_page_timeout(mock_get, extractor):
         extractor.fetch_page("https://example.com/recipe")
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_fetch_page_http_error(mock_get, extractor):
     """Test handling of HTTP errors."""
     import requests
@@ -191,7 +193,7 @@ def test_fetch_page_http_error(mock_get, extractor):
         extractor.fetch_page("https://example.com/recipe")
 
 
-@patch("recipe_duck.url_extractor.requests.get")
+@patch("recipe_duck.url_extractor.requests.Session.get")
 def test_fetch_page_connection_error(mock_get, extractor):
     """Test handling of connection errors."""
     import requests
@@ -200,3 +202,79 @@ def test_fetch_page_connection_error(mock_get, extractor):
 
     with pytest.raises(Exception, match="Failed to fetch URL"):
         extractor.fetch_page("https://example.com/recipe")
+
+
+@patch("recipe_duck.url_extractor.requests.Session.get")
+def test_fetch_page_serves_fresh_cache(mock_get, tmp_path):
+    """Test that a cached page is reused without a request while fresh."""
+    mock_response = Mock()
+    mock_response.text = "<html>Test</html>"
+    mock_response.status_code = 200
+    mock_response.headers = {"ETag": '"v1"'}
+    mock_get.return_value = mock_response
+
+    extractor = URLRecipeExtractor(cache_dir=tmp_path)
+    assert extractor.fetch_page("https://example.com/recipe") == "<html>Test</html>"
+    assert (
+        URLRecipeExtractor(cache_dir=tmp_path).fetch_page("https://example.com/recipe")
+        == "<html>Test</html>"
+    )
+
+    mock_get.assert_called_once()
+
+
+@patch("recipe_duck.url_extractor.time.time")
+@patch("recipe_duck.url_extractor.requests.Session.get")
+def test_fetch_page_revalidates_stale_cache(mock_get, mock_time, tmp_path):
+    """Test that a stale cached page is revalidated and reused on 304."""
+    mock_response = Mock()
+    mock_response.text = "<html>Test</html>"
+    mock_response.status_code = 200
+    mock_response.headers = {"ETag": '"v1"'}
+    mock_get.return_value = mock_response
+    mock_time.return_value = 1000.0
+
+    extractor = URLRecipeExtractor(cache_dir=tmp_path)
+    extractor.fetch_page("https://example.com/recipe")
+
+    not_modified = Mock()
+    not_modified.status_code = 304
+    mock_get.return_value = not_modified
+    mock_time.return_value = 1000.0 + 2 * 3600
+
+    assert extractor.fetch_page("https://example.com/recipe") == "<html>Test</html>"
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+@patch("recipe_duck.url_extractor.requests.Session.get")
+def test_fetch_page_with_unwritable_cache(mock_get, tmp_path):
+    """Test that a cache directory that can't be written doesn't fail the fetch."""
+    mock_response = Mock()
+    mock_response.text = "<html>Test</html>"
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_get.return_value = mock_response
+    cache_dir = tmp_path / "not-a-directory"
+    cache_dir.write_text("")
+
+    extractor = URLRecipeExtractor(cache_dir=cache_dir)
+
+    assert extractor.fetch_page("https://example.com/recipe") == "<html>Test</html>"
+
+
+def test_page_cache_concurrent_writes_of_one_url(tmp_path):
+    """Test that threads storing the same page don't race on a shared temp file."""
+    extractor = URLRecipeExtractor(cache_dir=tmp_path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda i: extractor._write_page_cache(
+                    "https://example.com/recipe", f"<html>{i}</html>", None, None
+                ),
+                range(32),
+            )
+        )
+
+    assert extractor._read_page_cache("https://example.com/recipe")["html"].startswith("<html>")
+    assert len(list(tmp_path.iterdir())) == 1